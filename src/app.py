@@ -3,35 +3,93 @@ This module creates a GUI application for Spotify Skip Tracker using customtkint
 It handles user authentication, playback monitoring, and displays logs within the interface.
 """
 
+import functools
 import os
 import sys
 import threading
-import webbrowser
-import time
-from typing import Callable, Optional, Dict, Any, List
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 from flask import Flask
-from auth import login_bp, callback_bp, is_token_valid, stop_flag
+from auth import (
+    clear_tokens,
+    login_bp,
+    callback_bp,
+    is_token_valid,
+    refresh_access_token,
+    seconds_until_token_refresh,
+    stop_flag,
+)
 from gui.home_tab import HomeTab
 from gui.skipped_tab import SkippedTab
 from gui.settings_tab import SettingsTab
 from playback import main as playback_main
 from logging_config import setup_logger
 from utils import get_user_id, resource_path  # pylint: disable=import-error
-from config_utils import load_config, set_config_variable  # pylint: disable=import-error
-
+from config_utils import (  # pylint: disable=import-error
+    ENCRYPTED_KEYS,
+    load_config,
+    set_config_variables,
+)
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    _HAS_WATCHDOG: bool = True
+except ImportError:
+    _HAS_WATCHDOG = False
+
+# Seconds between log file checks when no change notifications are available
+_LOG_POLL_INTERVAL: float = 1.0
+# Seconds between log file checks when watchdog reports changes, in case a change
+# notification is missed
+_LOG_WATCH_INTERVAL: float = 5.0
+# Minimum seconds between log text box updates, so bursts of log lines are
+# appended in one batch
+_LOG_BATCH_INTERVAL: float = 0.05
+# Bytes read per step when scanning backwards for the lines to display
+_LOG_TAIL_BLOCK_SIZE: int = 64 * 1024
+# Bytes at the end of the log searched for the playback monitor's critical error
+_CRITICAL_ERROR_TAIL_SIZE: int = 64 * 1024
+_CRITICAL_ERROR_MARKER: bytes = (
+    b" - CRITICAL - PlaybackMonitor encountered a critical error: "
+)
+# Seconds to wait before retrying a failed background token refresh
+_TOKEN_REFRESH_RETRY_INTERVAL: float = 60.0
+# Delay bounds in seconds before restarting the OAuth server after it stops
+_FLASK_RETRY_INITIAL: float = 1.0
+_FLASK_RETRY_MAX: float = 30.0
+# Configuration variables that must be set before authenticating
+_REQUIRED_AUTH_KEYS: Tuple[str, ...] = (
+    "SPOTIFY_CLIENT_ID",
+    "SPOTIFY_CLIENT_SECRET",
+    "SPOTIFY_REDIRECT_URI",
+)
 
 # Initialize logging
 logger = setup_logger()
-_log_level = load_config().get("LOG_LEVEL", "INFO")
+# The first load at startup writes any missing required keys to config.json, so
+# later reads do not have to
+_log_level = load_config(persist_defaults=True).get("LOG_LEVEL", "INFO")
 logger.setLevel(_log_level)
 
-# Initialize Flask app for OAuth callback
-_flask_app = Flask(__name__)
-_flask_app.register_blueprint(login_bp, url_prefix="/login")
-_flask_app.register_blueprint(callback_bp, url_prefix="/callback")
+
+@functools.lru_cache(maxsize=None)
+def _get_flask_app() -> Flask:
+    """
+    Create the Flask app for the OAuth callback the first time it is needed.
+
+    Returns:
+        Flask: The Flask app with the login and callback blueprints registered.
+    """
+    flask_app = Flask(__name__)
+    flask_app.register_blueprint(login_bp, url_prefix="/login")
+    flask_app.register_blueprint(callback_bp, url_prefix="/callback")
+    return flask_app
+
 
 _config = load_config()
 ctk.set_appearance_mode(_config.get("APPEARANCE_MODE", "System"))
@@ -41,6 +99,176 @@ else:
     ctk.set_default_color_theme(_config.get("COLOR_THEME", "blue"))
 
 
+# Log levels in order of severity
+_LOG_LEVELS: List[str] = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+def _parse_log_display_settings(
+    log_line_count_str: Any, log_level_display: Any
+) -> Tuple[int, List[bytes]]:
+    """
+    Parse the log display settings, falling back to the defaults for invalid values.
+
+    Args:
+        log_line_count_str (Any): The LOG_LINE_COUNT setting.
+        log_level_display (Any): The LOG_LEVEL_DISPLAY setting.
+
+    Returns:
+        Tuple[int, List[bytes]]: The number of log lines to display and the
+            encoded names of the log levels to display.
+    """
+    try:
+        log_line_count = int(log_line_count_str)
+    except (TypeError, ValueError) as e:
+        logger.error(
+            "Invalid LOG_LINE_COUNT value '%s'; defaulting to 500. Error: %s",
+            log_line_count_str,
+            e,
+        )
+        log_line_count = 500
+
+    try:
+        display_level_index = _LOG_LEVELS.index(log_level_display)
+    except ValueError:
+        logger.error(
+            "Invalid LOG_LEVEL_DISPLAY value '%s'; defaulting to INFO.",
+            log_level_display,
+        )
+        display_level_index = _LOG_LEVELS.index("INFO")
+
+    return log_line_count, [
+        level.encode() for level in _LOG_LEVELS[display_level_index:]
+    ]
+
+
+def _find_log_tail_offset(
+    log_file_path: str, end: int, line_count: int, display_levels: List[bytes]
+) -> int:
+    """
+    Find where the last displayable lines of the log file start.
+
+    The file is scanned backwards in blocks from end until line_count complete
+    lines matching one of the display levels have been seen, so only the tail of
+    a large log has to be read.
+
+    Args:
+        log_file_path (str): Path to the log file.
+        end (int): Offset to scan backwards from, usually the file size.
+        line_count (int): Number of matching lines to display.
+        display_levels (List[bytes]): Encoded names of the log levels to display.
+
+    Returns:
+        int: Offset of the start of the earliest line to display, or 0 when the
+            whole file is needed.
+    """
+    if line_count <= 0:
+        return end
+
+    position: int = end
+    matched: int = 0
+    carry: bytes = b""
+    skip_partial: bool = True
+    with open(log_file_path, "rb") as log_file:
+        while position > 0:
+            read_size: int = min(_LOG_TAIL_BLOCK_SIZE, position)
+            position -= read_size
+            log_file.seek(position)
+            data: bytes = log_file.read(read_size) + carry
+            pieces: List[bytes] = data.split(b"\n")
+
+            # The first piece may continue in the previous block
+            carry = pieces[0]
+            cursor: int = position + len(data)
+            for index in range(len(pieces) - 1, 0, -1):
+                line: bytes = pieces[index]
+                cursor -= len(line) + 1
+                if skip_partial:
+                    # Text after the final newline is not displayed until complete
+                    skip_partial = False
+                    continue
+                if any(level in line for level in display_levels):
+                    matched += 1
+                    if matched >= line_count:
+                        return cursor + 1
+    return 0
+
+
+def _log_exceptions(
+    message: str,
+    level: str = "error",
+    reraise: bool = False,
+    critical_on_fail: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Create a decorator that logs exceptions raised by a SpotifySkipTrackerGUI method.
+
+    Args:
+        message (str): Log message, formatted with the exception.
+        level (str, optional): Name of the logger method to log with. Defaults to
+            "error".
+        reraise (bool, optional): Whether to re-raise the exception after logging
+            it. Defaults to False.
+        critical_on_fail (bool, optional): Whether to record the error message and
+            signal the critical error event, so the application reports it and
+            closes. Defaults to False.
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: The decorator.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                getattr(logger, level)(message, e)
+                if critical_on_fail:
+                    # pylint: disable=protected-access
+                    self._error_message = str(e)
+                    self._critical_error_event.set()
+                if reraise:
+                    raise
+                return None
+
+        return wrapper
+
+    return decorator
+
+
+if _HAS_WATCHDOG:
+
+    class _LogFileHandler(FileSystemEventHandler):
+        """
+        Watchdog event handler that signals when the log file changes.
+        """
+
+        def __init__(self, log_file_path: str, log_changed: threading.Event) -> None:
+            """
+            Initialize the _LogFileHandler.
+
+            Args:
+                log_file_path (str): Path to the log file.
+                log_changed (threading.Event): Event set whenever the log file changes.
+            """
+            super().__init__()
+            self._log_file_path: str = os.path.abspath(log_file_path)
+            self._log_changed: threading.Event = log_changed
+
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            """
+            Set the log changed event if the log file was created, modified, or moved.
+
+            Args:
+                event (FileSystemEvent): The file system event.
+            """
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(
+                path and os.path.abspath(path) == self._log_file_path for path in paths
+            ):
+                self._log_changed.set()
+
+
 class HeaderFrame:
     """
     A header frame containing Login and Logout buttons for the Spotify Skip Tracker GUI.
@@ -125,17 +353,14 @@ class SpotifySkipTrackerGUI(ctk.CTk):
 
             # Start loading log file
             self._tabs.log.log_file_path = os.path.join("logs", "spotify_app.log")
+            self._start_log_observer()
             self._tabs.log.update_log_text_box_thread = threading.Thread(
                 target=self._update_log_text_box, daemon=True
             )
             self._tabs.log.update_log_text_box_thread.start()
 
-            # Load configuration
-            self._auth.config = load_config(decrypt=True)
-            self._auth.access_token = self._auth.config.get("SPOTIFY_ACCESS_TOKEN", "")
-            self._auth.refresh_token = self._auth.config.get(
-                "SPOTIFY_REFRESH_TOKEN", ""
-            )
+            # Load configuration; encrypted values are decrypted in the background
+            self._auth.config = load_config()
             self._auth.user_id = None
 
             self._stop_event = threading.Event()
@@ -146,12 +371,9 @@ class SpotifySkipTrackerGUI(ctk.CTk):
 
             self._create_header()
             self._create_tab_view()
+            self.bind("<<FlaskStopped>>", self._check_flask_thread)
 
-            if self._auth.access_token and is_token_valid():
-                self._auth.user_id = get_user_id()
-                self._start_playback_monitoring()
-            else:
-                logger.info("Access token not found or invalid. Please authenticate.")
+            threading.Thread(target=self._load_auth_state, daemon=True).start()
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.critical("Failed to initialize SpotifySkipTrackerGUI: %s", e)
             self._error_message = str(e)
@@ -159,8 +381,9 @@ class SpotifySkipTrackerGUI(ctk.CTk):
             self.terminate_application()
             raise
 
-        # Start the periodic check for critical errors
-        self._check_for_critical_errors()
+        # Report critical errors on the Tk main thread as soon as they are signalled
+        self.bind("<<CriticalError>>", self._handle_critical_error)
+        threading.Thread(target=self._wait_for_critical_error, daemon=True).start()
 
     class AuthState:  # pylint: disable=too-few-public-methods
         """
@@ -175,6 +398,10 @@ class SpotifySkipTrackerGUI(ctk.CTk):
             self.access_token: str = ""
             self.refresh_token: str = ""
             self.user_id: Optional[str] = None
+            self.config_decrypted: threading.Event = threading.Event()
+            # Redirect URI the port was last parsed from, and the parsed port
+            self.redirect_uri: str = ""
+            self.redirect_port: int = 5000
 
     class ThreadState:  # pylint: disable=too-few-public-methods
         """
@@ -187,7 +414,16 @@ class SpotifySkipTrackerGUI(ctk.CTk):
             """
             self.playback_thread: Optional[threading.Thread] = None
             self.flask_thread: Optional[threading.Thread] = None
+            self.flask_server: Optional[Any] = None
+            self.flask_port: int = 5000
+            self.token_timer: Optional[threading.Timer] = None
+            # Held while the access token is refreshed in the background and while
+            # logout clears the tokens, so a refresh cannot restore them
+            self.token_refresh_lock: threading.Lock = threading.Lock()
             self.stop_event: threading.Event = threading.Event()
+            # Set when the window is closed so background loops exit without
+            # finishing their current wait
+            self.shutdown_event: threading.Event = threading.Event()
 
     class TabState:  # pylint: disable=too-few-public-methods
         """
@@ -202,6 +438,10 @@ class SpotifySkipTrackerGUI(ctk.CTk):
             self.skipped_tab: Optional[SkippedTab] = None
             self.settings_tab: Optional[SettingsTab] = None
             self.log = self.LogState()
+            # Latest playback waiting to be shown, coalesced across worker updates
+            self.pending_playback: Optional[Dict[str, Any]] = None
+            self.playback_update_scheduled: bool = False
+            self.playback_update_lock: threading.Lock = threading.Lock()
 
         class LogState:  # pylint: disable=too-few-public-methods
             """
@@ -214,99 +454,213 @@ class SpotifySkipTrackerGUI(ctk.CTk):
                 """
                 self.log_file_path: str = ""
                 self.update_log_text_box_thread: Optional[threading.Thread] = None
+                self.log_changed: threading.Event = threading.Event()
+                # Set while the Home tab, which displays the log, is selected
+                self.home_visible: threading.Event = threading.Event()
+                self.home_visible.set()
+                # Set until the log display settings have been parsed
+                self.settings_changed: threading.Event = threading.Event()
+                self.settings_changed.set()
+                self.observer: Optional[Any] = None
+
+    def _load_auth_state(self) -> None:
+        """
+        Decrypt the configuration and validate the access token off the Tk main
+        thread, then apply the result on the main thread.
+        """
+        try:
+            config: Dict[str, Any] = load_config(decrypt=True)
+            token_valid: bool = False
+            user_id: Optional[str] = None
+            if config.get("SPOTIFY_ACCESS_TOKEN", ""):
+                # Validate the token and fetch the user ID concurrently, so startup
+                # waits for the slower request rather than both in turn
+                executor = ThreadPoolExecutor(max_workers=2)
+                try:
+                    token_valid_future = executor.submit(is_token_valid)
+                    user_id_future = executor.submit(get_user_id)
+                    token_valid = token_valid_future.result()
+                    user_id = user_id_future.result() if token_valid else None
+                finally:
+                    # Do not wait for the user ID when the token turned out invalid
+                    executor.shutdown(wait=False)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.critical("Failed to load authentication state: %s", e)
+            self._error_message = str(e)
+            self._critical_error_event.set()
+            return
+        self.after(0, self._apply_auth_state, config, token_valid, user_id)
+
+    def _apply_auth_state(
+        self, config: Dict[str, Any], token_valid: bool, user_id: Optional[str]
+    ) -> None:
+        """
+        Apply the decrypted configuration and start playback monitoring if the
+        access token is valid.
+
+        Args:
+            config (Dict[str, Any]): The decrypted configuration.
+            token_valid (bool): Whether the access token is valid.
+            user_id (Optional[str]): The Spotify user ID, if the token is valid.
+        """
+        # Update in place, since the tabs hold a reference to this dictionary
+        self._auth.config.update(config)
+        self._auth.access_token = config.get("SPOTIFY_ACCESS_TOKEN", "")
+        self._auth.refresh_token = config.get("SPOTIFY_REFRESH_TOKEN", "")
+        self._auth.config_decrypted.set()
+
+        if token_valid:
+            self._auth.user_id = user_id
+            self._start_playback_monitoring()
+        else:
+            logger.info("Access token not found or invalid. Please authenticate.")
 
+    @_log_exceptions("Failed to create header frame: %s")
     def _create_header(self) -> None:
         """
         Create the header frame with the login and logout buttons using HeaderFrame class.
         """
-        try:
-            self.header = HeaderFrame(
-                self,
-                authenticate_callback=self.authenticate,
-                logout_callback=self.logout,
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.error("Failed to create header frame: %s", e)
+        self.header = HeaderFrame(
+            self,
+            authenticate_callback=self.authenticate,
+            logout_callback=self.logout,
+        )
 
+    @_log_exceptions("Failed to create tab view: %s", level="critical", reraise=True)
     def _create_tab_view(self) -> None:
         """
         Create the tabbed interface with Home, Skipped, and Settings tabs.
+
+        Only the Home tab is built immediately; the Skipped and Settings tabs are
+        built the first time they are selected.
         """
-        try:
-            self.tab_view = ctk.CTkTabview(self, width=850, height=600)
-            self.tab_view.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
+        self.tab_view = ctk.CTkTabview(
+            self, width=850, height=600, command=self._on_tab_changed
+        )
+        self.tab_view.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
+
+        # Add tabs
+        self.tab_view.add("Home")
+        self.tab_view.add("Skipped")
+        self.tab_view.add("Settings")
+
+        # Configure the initially visible tab
+        self._create_home_tab()
 
-            # Add tabs
-            self.tab_view.add("Home")
-            self.tab_view.add("Skipped")
-            self.tab_view.add("Settings")
+    @_log_exceptions("Failed to create selected tab: %s")
+    def _on_tab_changed(self) -> None:
+        """
+        Build the selected tab the first time it is shown, and pause log tailing
+        while the Home tab is hidden.
+        """
+        selected_tab: str = self.tab_view.get()
+        if selected_tab == "Home":
+            self._tabs.log.home_visible.set()
+        else:
+            self._tabs.log.home_visible.clear()
 
-            # Configure each tab
-            self._create_home_tab()
+        if selected_tab == "Skipped" and self._tabs.skipped_tab is None:
             self._create_skipped_tab()
+        elif selected_tab == "Settings" and self._tabs.settings_tab is None:
+            if not self._auth.config_decrypted.is_set():
+                # The settings show decrypted values, so wait for them
+                self.after(100, self._on_tab_changed)
+                return
             self._create_settings_tab()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Failed to create tab view: %s", e)
-            raise
 
+    @_log_exceptions("Failed to create Home tab: %s", level="critical", reraise=True)
     def _create_home_tab(self) -> None:
         """
         Create the Home tab by instantiating the HomeTab class.
         """
-        try:
-            home_frame = self.tab_view.tab("Home")
-            self._tabs.home_tab = HomeTab(
-                home_frame, logger, self._tabs.log.log_file_path
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Failed to create Home tab: %s", e)
-            raise
+        home_frame = self.tab_view.tab("Home")
+        self._tabs.home_tab = HomeTab(home_frame, logger, self._tabs.log.log_file_path)
 
+    @_log_exceptions("Failed to create Skipped tab: %s", level="critical", reraise=True)
     def _create_skipped_tab(self) -> None:
         """
         Create the Skipped tab by instantiating the SkippedTab class.
         """
-        try:
-            skipped_frame = self.tab_view.tab("Skipped")
-            self._tabs.skipped_tab = SkippedTab(
-                skipped_frame, self._auth.config, logger
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Failed to create Skipped tab: %s", e)
-            raise
+        skipped_frame = self.tab_view.tab("Skipped")
+        self._tabs.skipped_tab = SkippedTab(skipped_frame, self._auth.config, logger)
 
+    @_log_exceptions(
+        "Failed to create Settings tab: %s", level="critical", reraise=True
+    )
     def _create_settings_tab(self) -> None:
         """
         Create the Settings tab by instantiating the SettingsTab class.
         """
-        try:
-            settings_frame = self.tab_view.tab("Settings")
-            self._tabs.settings_tab = SettingsTab(
-                settings_frame, self._auth.config, logger
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Failed to create Settings tab: %s", e)
-            raise
+        settings_frame = self.tab_view.tab("Settings")
+        self._tabs.settings_tab = SettingsTab(
+            settings_frame,
+            self._auth.config,
+            logger,
+            log_settings_callback=self._on_log_settings_changed,
+        )
 
+    @_log_exceptions("Failed during authentication process: %s")
     def authenticate(self) -> None:
         """
-        Authenticate the user with Spotify by starting the Flask server and opening the login page.
+        Authenticate the user with Spotify.
+
+        A stored refresh token is tried first, and the Flask server is only started
+        and the login page opened if it cannot be used to obtain an access token.
         """
-        try:
-            # Check for required configuration variables
-            missing_vars = self._get_missing_config_variables()
-            if missing_vars:
-                self._prompt_for_config_variables(missing_vars)
-                return
+        # Check for required configuration variables
+        missing_vars = self._get_missing_config_variables()
+        if missing_vars:
+            self._prompt_for_config_variables(missing_vars)
+            return
 
-            # Start Flask server in a separate thread
-            self._start_flask_server()
+        if self._auth.refresh_token:
+            threading.Thread(
+                target=self._authenticate_with_refresh_token, daemon=True
+            ).start()
+            return
 
-            # Open the browser for Spotify login
-            logger.info("Starting authentication process...")
-            webbrowser.open(f"http://localhost:{self._get_port()}/login")
+        self._start_authorization_flow()
+
+    def _authenticate_with_refresh_token(self) -> None:
+        """
+        Try to obtain a new access token with the stored refresh token off the Tk
+        main thread, then finish authenticating on the main thread.
+        """
+        try:
+            refreshed: bool = refresh_access_token()
         except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.error("Failed during authentication process: %s", e)
+            logger.error("Failed to authenticate with the refresh token: %s", e)
+            refreshed = False
+        self.after(0, self._finish_refresh_authentication, refreshed)
+
+    def _finish_refresh_authentication(self, refreshed: bool) -> None:
+        """
+        Start playback monitoring if the refresh token worked, otherwise fall back to
+        the interactive login.
+
+        Args:
+            refreshed (bool): Whether a new access token was obtained.
+        """
+        if refreshed:
+            logger.info("Authenticated with the stored refresh token.")
+            self._start_playback_monitoring()
+        else:
+            self._start_authorization_flow()
+
+    @_log_exceptions("Failed during authentication process: %s")
+    def _start_authorization_flow(self) -> None:
+        """
+        Start the Flask server and open the Spotify login page in the browser.
+        """
+        # Start Flask server in a separate thread
+        self._start_flask_server()
+
+        # Imported here as it is only needed once the user has to log in
+        import webbrowser  # pylint: disable=import-outside-toplevel
+
+        # Open the browser for Spotify login
+        logger.info("Starting authentication process...")
+        webbrowser.open(f"http://localhost:{self._threads.flask_port}/login")
 
     def _get_missing_config_variables(self) -> List[str]:
         """
@@ -316,16 +670,16 @@ class SpotifySkipTrackerGUI(ctk.CTk):
             List[str]: A list of missing configuration keys.
         """
         try:
-            required_keys = [
-                "SPOTIFY_CLIENT_ID",
-                "SPOTIFY_CLIENT_SECRET",
-                "SPOTIFY_REDIRECT_URI",
-            ]
-            self._auth.config = load_config(decrypt=True)
-            missing = [key for key in required_keys if not self._auth.config.get(key)]
-            return missing
+            # The in-memory config is kept in sync by the popup and Settings tab, so
+            # it only has to be read from disk while startup decryption is running
+            config: Dict[str, Any] = (
+                self._auth.config
+                if self._auth.config_decrypted.is_set()
+                else load_config(decrypt=True)
+            )
+            return [key for key in _REQUIRED_AUTH_KEYS if not config.get(key)]
         except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.error("Failed to get missing configuration variables: %s", e)
+            logger.error("Failed to get missing configuration variables: %s", e)
             return []
 
     def _prompt_for_config_variables(self, missing_vars: List[str]) -> None:
@@ -340,22 +694,23 @@ class SpotifySkipTrackerGUI(ctk.CTk):
         popup.geometry("500x400")
         popup.grab_set()  # Make the popup modal
 
-        entries: Dict[str, ctk.CTkEntry] = {}
-        for var in missing_vars:
-            frame = ctk.CTkFrame(popup)
-            frame.pack(pady=10, padx=20, fill="x")
+        container = ctk.CTkFrame(popup)
+        container.pack(pady=10, padx=20, fill="x")
 
-            label = ctk.CTkLabel(frame, text=f"{var}:", width=160, anchor="w")
-            label.pack(side="left", padx=5, pady=5)
+        entries: Dict[str, ctk.CTkEntry] = {}
+        for row, var in enumerate(missing_vars):
+            label = ctk.CTkLabel(container, text=f"{var}:", width=160, anchor="w")
+            label.grid(row=row, column=0, padx=5, pady=10, sticky="w")
 
-            entry = ctk.CTkEntry(frame, width=300)
-            entry.pack(side="left", padx=5, pady=5)
+            entry = ctk.CTkEntry(container, width=300)
+            entry.grid(row=row, column=1, padx=5, pady=10, sticky="ew")
             entries[var] = entry
 
         def _save_and_close() -> None:
             """
             Save the entered configuration variables and close the popup.
             """
+            values: Dict[str, str] = {}
             for var, entry in entries.items():
                 value = entry.get().strip()
                 if not value:
@@ -366,11 +721,10 @@ class SpotifySkipTrackerGUI(ctk.CTk):
                         justify="center",
                     )
                     return
-                if var in ["SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET"]:
-                    set_config_variable(var, value, encrypt=True)
-                else:
-                    set_config_variable(var, value)
-                self._auth.config[var] = value
+                values[var] = value
+
+            set_config_variables(values, encrypt_keys=ENCRYPTED_KEYS)
+            self._auth.config.update(values)
 
             popup.destroy()
             CTkMessagebox(
@@ -388,213 +742,411 @@ class SpotifySkipTrackerGUI(ctk.CTk):
         """
         Get the port number from the redirect URI.
 
+        The URI is only parsed again after it has been changed.
+
         Returns:
             int: The port number.
         """
-        redirect_uri = self._auth.config.get(
+        redirect_uri: str = self._auth.config.get(
             "SPOTIFY_REDIRECT_URI", "http://localhost:5000/callback"
         )
-        parsed_uri = requests.utils.urlparse(redirect_uri)
-        return parsed_uri.port or 5000
+        if redirect_uri != self._auth.redirect_uri:
+            self._auth.redirect_port = urlsplit(redirect_uri).port or 5000
+            self._auth.redirect_uri = redirect_uri
+        return self._auth.redirect_port
 
+    @_log_exceptions("Failed to start Flask server thread: %s")
     def _start_flask_server(self) -> None:
         """
         Start the Flask server in a separate thread.
         """
-        try:
-            if (
-                not self._threads.flask_thread
-                or not self._threads.flask_thread.is_alive()
-            ):
-                self._threads.flask_thread = threading.Thread(
-                    target=self._run_flask, daemon=True
-                )
-                self._threads.flask_thread.start()
-                # Monitor the Flask thread
-                self.after(100, self._check_flask_thread)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.error("Failed to start Flask server thread: %s", e)
+        if not self._threads.flask_thread or not self._threads.flask_thread.is_alive():
+            # Resolve the port once; the running server keeps listening on it
+            self._threads.flask_port = self._get_port()
+            # Allow authenticating again after a previous login completed
+            stop_flag.clear()
+            self._threads.flask_thread = threading.Thread(
+                target=self._run_flask, daemon=True
+            )
+            self._threads.flask_thread.start()
+            # Wait for the OAuth callback without polling from the Tk loop
+            threading.Thread(target=self._wait_for_authentication, daemon=True).start()
 
+    @_log_exceptions(
+        "Critical failure in run_flask: %s", level="critical", reraise=True
+    )
     def _run_flask(self) -> None:
         """
         Run the Flask server for handling OAuth callbacks.
+
+        The server socket is bound once and served until authentication completes
+        and the server is shut down. Failed starts are retried with exponential
+        backoff, and the retry wait ends as soon as authentication completes.
         """
-        try:
-            while not stop_flag.is_set():
+        # Imported here as the server is only needed once the user has to log in
+        from werkzeug.serving import (  # pylint: disable=import-outside-toplevel
+            make_server,
+        )
+
+        backoff: float = _FLASK_RETRY_INITIAL
+        while not stop_flag.is_set():
+            try:
+                server = make_server(
+                    "127.0.0.1",
+                    self._threads.flask_port,
+                    _get_flask_app(),
+                    threaded=True,
+                )
+                self._threads.flask_server = server
                 try:
-                    _flask_app.run(
-                        port=self._get_port(), debug=False, use_reloader=False
-                    )
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.error("Error running Flask server: %s", e)
-                time.sleep(1)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Critical failure in run_flask: %s", e)
-            raise
+                    server.serve_forever()
+                finally:
+                    self._threads.flask_server = None
+                    server.server_close()
+                backoff = _FLASK_RETRY_INITIAL
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(
+                    "Error running Flask server, retrying in %.0fs: %s", backoff, e
+                )
+            if stop_flag.wait(timeout=backoff):
+                break
+            backoff = min(backoff * 2, _FLASK_RETRY_MAX)
 
-    def _check_flask_thread(self) -> None:
+    def _wait_for_authentication(self) -> None:
         """
-        Check the status of the Flask thread and start playback monitoring
-        if the thread has stopped.
+        Block until the OAuth callback signals the Flask server to stop, shut the
+        server down, then notify the Tk main thread with a <<FlaskStopped>> virtual
+        event.
         """
+        stop_flag.wait()
+        server = self._threads.flask_server
+        if server:
+            try:
+                server.shutdown()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Failed to shut down Flask server: %s", e)
         try:
-            if stop_flag.is_set():
-                self._start_playback_monitoring()
-                try:
-                    if (
-                        self._threads.flask_thread
-                        and self._threads.flask_thread.is_alive()
-                    ):
-                        self._threads.flask_thread = None
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.error("Error joining Flask thread: %s", e)
-            else:
-                # Check again after 100ms
-                self.after(100, self._check_flask_thread)
+            self.event_generate("<<FlaskStopped>>", when="tail")
         except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Critical failure in check_flask_thread: %s", e)
-            raise
+            logger.error("Failed to signal Flask server shutdown: %s", e)
+
+    @_log_exceptions(
+        "Critical failure in check_flask_thread: %s", level="critical", reraise=True
+    )
+    def _check_flask_thread(self, _: Any = None) -> None:
+        """
+        Start playback monitoring once the Flask server has been signalled to stop.
 
+        Args:
+            _ (Any, optional): The <<FlaskStopped>> event. Defaults to None.
+        """
+        if stop_flag.is_set():
+            self._start_playback_monitoring()
+            try:
+                if self._threads.flask_thread and self._threads.flask_thread.is_alive():
+                    self._threads.flask_thread = None
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error joining Flask thread: %s", e)
+
+    @_log_exceptions(
+        "Failed to start playback monitoring thread: %s",
+        level="critical",
+        reraise=True,
+        critical_on_fail=True,
+    )
     def _start_playback_monitoring(self) -> None:
         """
         Start the playback monitoring thread.
         """
-        try:
-            if (
-                self._threads.playback_thread
-                and self._threads.playback_thread.is_alive()
-            ):
+        if self._threads.playback_thread and self._threads.playback_thread.is_alive():
+            return
+        self._threads.stop_event.clear()
+        self._threads.playback_thread = threading.Thread(
+            target=self._monitor_playback,
+            args=(self._critical_error_event,),
+            daemon=True,
+        )
+        self._threads.playback_thread.start()
+        self._schedule_token_refresh(seconds_until_token_refresh())
+
+    def _schedule_token_refresh(self, delay: float) -> None:
+        """
+        Schedule a background refresh of the access token, replacing any pending one.
+
+        Args:
+            delay (float): Seconds to wait before refreshing the token.
+        """
+        if self._threads.token_timer:
+            self._threads.token_timer.cancel()
+        self._threads.token_timer = threading.Timer(
+            delay, self._refresh_token_in_background
+        )
+        self._threads.token_timer.daemon = True
+        self._threads.token_timer.start()
+        logger.debug("Access token refresh scheduled in %.0f seconds.", delay)
+
+    def _refresh_token_in_background(self) -> None:
+        """
+        Refresh the access token before it expires, so playback monitoring does not
+        stall on an expired token, and schedule the next refresh.
+
+        Nothing is stored or rescheduled once logout has started.
+        """
+        with self._threads.token_refresh_lock:
+            if self._threads.stop_event.is_set():
                 return
-            self._threads.stop_event.clear()
-            self._threads.playback_thread = threading.Thread(
-                target=self._monitor_playback,
-                args=(self._critical_error_event,),
-                daemon=True,
+            try:
+                refresh_access_token(cancelled=self._threads.stop_event)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Background access token refresh failed: %s", e)
+            if self._threads.stop_event.is_set():
+                return
+            # No time left before the refresh margin means the refresh failed; retry
+            # later
+            self._schedule_token_refresh(
+                seconds_until_token_refresh() or _TOKEN_REFRESH_RETRY_INTERVAL
             )
-            self._threads.playback_thread.start()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Failed to start playback monitoring thread: %s", e)
-            self._error_message = str(e)
-            self._critical_error_event.set()
-            self.terminate_application()
-            raise
 
+    @_log_exceptions(
+        "Critical failure in monitor_playback: %s",
+        level="critical",
+        reraise=True,
+        critical_on_fail=True,
+    )
     def _monitor_playback(self, critical_error_event: threading.Event) -> None:
         """
         Monitor playback by running the PlaybackMonitor.
         """
-        try:
+        # Reuse the user ID fetched while validating the token at startup
+        if not self._auth.user_id:
             self._auth.user_id = get_user_id()
-            playback_main(
-                self._threads.stop_event,
-                self.update_playback_info,
-                critical_error_event,
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Critical failure in monitor_playback: %s", e)
-            self._error_message = str(e)
-            critical_error_event.set()
-            raise
+        playback_main(
+            self._threads.stop_event,
+            self.update_playback_info,
+            critical_error_event,
+        )
 
+    @_log_exceptions("Failed to update playback info: %s")
     def update_playback_info(self, playback: Optional[Dict[str, Any]]) -> None:
         """
         Update the playback information in the Home tab.
 
+        Called from the playback monitoring thread. The widgets are updated on the
+        Tk main thread, and updates that arrive before the previous one has been
+        applied are coalesced so only the latest playback is rendered.
+
         Args:
             playback (Optional[Dict[str, Any]]): The current playback information.
         """
+        with self._tabs.playback_update_lock:
+            self._tabs.pending_playback = playback
+            if self._tabs.playback_update_scheduled:
+                return
+            self._tabs.playback_update_scheduled = True
+        self.after(0, self._apply_playback_update)
+
+    def _apply_playback_update(self) -> None:
+        """
+        Render the latest pending playback information in the Home tab.
+        """
+        with self._tabs.playback_update_lock:
+            playback = self._tabs.pending_playback
+            self._tabs.playback_update_scheduled = False
         try:
             if self._tabs.home_tab:
                 self._tabs.home_tab.update_playback_info(playback, self._auth.user_id)
         except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.error("Failed to update playback info: %s", e)
+            logger.error("Failed to update playback info: %s", e)
 
-    def _update_log_text_box(self) -> None:
+    def _start_log_observer(self) -> None:
+        """
+        Watch the log file for changes with watchdog, if it is installed, so the
+        log text box is updated as soon as new lines are written.
+        """
+        if not _HAS_WATCHDOG:
+            return
+        try:
+            observer = Observer()
+            observer.schedule(
+                _LogFileHandler(
+                    self._tabs.log.log_file_path, self._tabs.log.log_changed
+                ),
+                os.path.dirname(self._tabs.log.log_file_path) or ".",
+                recursive=False,
+            )
+            observer.daemon = True
+            observer.start()
+            self._tabs.log.observer = observer
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to watch log file; falling back to polling: %s", e)
+            self._tabs.log.observer = None
+
+    def _on_log_settings_changed(self) -> None:
+        """
+        Rebuild the log text box with the log display settings just saved in the
+        Settings tab.
         """
-        Continuously update the log text box with the contents of the log file.
+        self._tabs.log.settings_changed.set()
+        self._tabs.log.log_changed.set()
+
+    def _update_log_text_box(self) -> None:
         """
-        previous_log_contents: str = ""
+        Continuously update the log text box with new lines from the log file.
 
-        # Define log levels in order of severity
-        log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+        Only the bytes appended since the previous read are loaded. When the log
+        is truncated or rotated, the log display settings change, or the Home tab
+        is shown again, the display is rebuilt from just the tail of the file
+        needed to fill it. Tailing is paused while the Home tab is hidden.
+        """
+        log_offset: int = 0
+        log_inode: int = -1
+        partial_line: bytes = b""
+        log_line_count: int = 500
+        display_levels: List[bytes] = []
 
         while True:
-            try:
-                with open(
-                    self._tabs.log.log_file_path, "r", encoding="utf-8"
-                ) as log_file:
-                    log_contents = log_file.readlines()
-            except FileNotFoundError as e:
-                self.logger.error("Log file not found: %s", e)
-                log_contents = []
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                self.logger.error("Failed to read log file: %s", e)
-                log_contents = []
+            if not self._tabs.home_tab:
+                # Keep the offset at the start of the log until it can be displayed
+                if self._threads.shutdown_event.wait(_LOG_POLL_INTERVAL):
+                    return
+                continue
+            # Pause while another tab is shown, then rebuild the display from the
+            # tail of the log instead of reading everything written meanwhile
+            resumed: bool = not self._tabs.log.home_visible.is_set()
+            if resumed:
+                self._tabs.log.home_visible.wait()
+                if self._threads.shutdown_event.is_set():
+                    return
 
-            # Get the number of log lines to display
-            log_line_count_str = self._auth.config.get("LOG_LINE_COUNT", "500")
-            try:
-                log_line_count = int(log_line_count_str)
-            except ValueError as e:
-                self.logger.error(
-                    "Invalid LOG_LINE_COUNT value '%s'; defaulting to 500. Error: %s",
-                    log_line_count_str,
-                    e,
+            # Parse the display settings only when the Settings tab reports a change
+            settings_changed: bool = self._tabs.log.settings_changed.is_set()
+            if settings_changed:
+                self._tabs.log.settings_changed.clear()
+                log_line_count, display_levels = _parse_log_display_settings(
+                    self._auth.config.get("LOG_LINE_COUNT", "500"),
+                    self._auth.config.get("LOG_LEVEL_DISPLAY", "INFO"),
                 )
-                log_line_count = 500
 
-            # Get the log level display setting
-            log_level_display = self._auth.config.get("LOG_LEVEL_DISPLAY", "INFO")
             try:
-                display_level_index = log_levels.index(log_level_display)
-            except ValueError:
-                self.logger.error(
-                    "Invalid LOG_LEVEL_DISPLAY value '%s'; defaulting to INFO.",
-                    log_level_display,
+                log_stat = os.stat(self._tabs.log.log_file_path)
+                reset: bool = (
+                    settings_changed
+                    or resumed
+                    or log_stat.st_size < log_offset
+                    or log_stat.st_ino != log_inode
                 )
-                display_level_index = log_levels.index("INFO")
-
-            # Filter logs based on the log level display setting
-            filtered_logs = [
-                line
-                for line in log_contents
-                if any(level in line for level in log_levels[display_level_index:])
-            ]
-
-            # Display the most recent filtered log lines
-            recent_logs = filtered_logs[-log_line_count:]
-            display_logs = "".join(recent_logs)
-
-            if display_logs != previous_log_contents:
-                try:
-                    if self._tabs.home_tab:
-                        self._tabs.home_tab.update_logs(display_logs)
-                    previous_log_contents = display_logs
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    self.logger.error(
-                        "Failed to update log text box in Home tab: %s", e
+                if reset:
+                    partial_line = b""
+                    log_inode = log_stat.st_ino
+                    log_offset = _find_log_tail_offset(
+                        self._tabs.log.log_file_path,
+                        log_stat.st_size,
+                        log_line_count,
+                        display_levels,
                     )
 
-            time.sleep(1)
+                if reset or log_stat.st_size != log_offset:
+                    with open(self._tabs.log.log_file_path, "rb") as log_file:
+                        log_file.seek(log_offset)
+                        chunk: bytes = log_file.read()
+                        log_offset = log_file.tell()
+
+                    # Hold back a trailing partial line until it is complete
+                    new_lines: List[bytes] = (partial_line + chunk).split(b"\n")
+                    partial_line = new_lines.pop()
+
+                    # Filter logs based on the log level display setting
+                    filtered_logs = [
+                        line.rstrip(b"\r").decode("utf-8", "replace") + "\n"
+                        for line in new_lines
+                        if any(level in line for level in display_levels)
+                    ]
+
+                    if reset or filtered_logs:
+                        self.after(
+                            0,
+                            self._tabs.home_tab.append_logs,
+                            "".join(filtered_logs[-log_line_count:]),
+                            log_line_count,
+                            reset,
+                        )
+                        # Let lines written in the meantime accumulate for one batch
+                        if self._threads.shutdown_event.wait(_LOG_BATCH_INTERVAL):
+                            return
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if isinstance(e, FileNotFoundError):
+                    logger.error("Log file not found: %s", e)
+                else:
+                    logger.error("Failed to update log text box in Home tab: %s", e)
+                # Logging the error modifies the log file, so pause instead of
+                # letting the change notification wake the loop straight away
+                if self._threads.shutdown_event.wait(_LOG_POLL_INTERVAL):
+                    return
+
+            # Wake up early when watchdog reports a change to the log file
+            self._tabs.log.log_changed.wait(
+                _LOG_WATCH_INTERVAL if self._tabs.log.observer else _LOG_POLL_INTERVAL
+            )
+            self._tabs.log.log_changed.clear()
+            if self._threads.shutdown_event.is_set():
+                return
 
     def logout(self) -> None:
         """
         Logout the user by clearing access and refresh tokens from the configuration.
+
+        Playback monitoring is stopped and the tokens are cleared in the background,
+        so the window stays responsive while the playback thread finishes.
         """
-        if self._threads.playback_thread and self._threads.playback_thread.is_alive():
-            self._threads.stop_event.set()
-            self._threads.playback_thread.join()
-            logger.info("Playback monitoring stopped.")
+        if hasattr(self, "header"):
+            self.header.logout_button.configure(state="disabled")
+
+        self._threads.stop_event.set()
+        # Cleared straight away so logging in again cannot reuse the old tokens
+        self._auth.access_token = ""
+        self._auth.refresh_token = ""
+        self._auth.user_id = None
 
         if self._threads.flask_thread:
             self._threads.flask_thread = None
 
-        set_config_variable("SPOTIFY_ACCESS_TOKEN", "", encrypt=True)
-        set_config_variable("SPOTIFY_REFRESH_TOKEN", "", encrypt=True)
+        if self._threads.token_timer:
+            self._threads.token_timer.cancel()
+            self._threads.token_timer = None
+
+        threading.Thread(target=self._logout_in_background, daemon=True).start()
+
+    def _logout_in_background(self) -> None:
+        """
+        Wait for playback monitoring to stop and clear the stored tokens off the Tk
+        main thread, then finish logging out on the main thread.
+        """
+        try:
+            playback_thread = self._threads.playback_thread
+            if playback_thread and playback_thread.is_alive():
+                playback_thread.join()
+                logger.info("Playback monitoring stopped.")
+
+            # Wait for an in-flight background refresh, which stops early once it
+            # sees the stop event, so it cannot store a token after they are cleared
+            with self._threads.token_refresh_lock:
+                if self._threads.token_timer:
+                    self._threads.token_timer.cancel()
+                    self._threads.token_timer = None
+                clear_tokens()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to clear tokens during logout: %s", e)
+        self.after(0, self._finish_logout)
+
+    def _finish_logout(self) -> None:
+        """
+        Clear the tokens from the shared config and the playback display, and
+        confirm the logout.
+        """
         self._auth.config["SPOTIFY_ACCESS_TOKEN"] = ""
         self._auth.config["SPOTIFY_REFRESH_TOKEN"] = ""
-        self._auth.access_token = ""
-        self._auth.refresh_token = ""
+        if hasattr(self, "header"):
+            self.header.logout_button.configure(state="normal")
         CTkMessagebox(
             title="Logout Successful",
             message="You have been logged out successfully.",
@@ -604,16 +1156,31 @@ class SpotifySkipTrackerGUI(ctk.CTk):
         logger.info("User logged out and tokens cleared.")
 
         # Clear playback info
-        if hasattr(self, "playback_info"):
-            self.playback_info.configure(state="normal")
-            self.playback_info.delete("1.0", "end")
-            self.playback_info.configure(state="disabled")
+        if self._tabs.home_tab:
+            self._tabs.home_tab.update_playback_info(None, "")
 
-        # Clear skipped songs display
-        if hasattr(self, "skipped_text"):
-            self.skipped_text.configure(state="normal")
-            self.skipped_text.delete("1.0", "end")
-            self.skipped_text.configure(state="disabled")
+    def destroy(self) -> None:
+        """
+        Stop the background loops, the log file observer, the token refresh timer and
+        the Home tab's album art workers, then destroy the window.
+        """
+        try:
+            # Wake the background loops so they exit instead of finishing their waits
+            self._threads.shutdown_event.set()
+            self._threads.stop_event.set()
+            self._tabs.log.home_visible.set()
+            self._tabs.log.log_changed.set()
+            if self._tabs.log.observer:
+                self._tabs.log.observer.stop()
+                self._tabs.log.observer = None
+            if self._threads.token_timer:
+                self._threads.token_timer.cancel()
+                self._threads.token_timer = None
+            if self._tabs.home_tab:
+                self._tabs.home_tab.shutdown()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to stop background watchers: %s", e)
+        super().destroy()
 
     def terminate_application(self) -> None:
         """
@@ -626,26 +1193,44 @@ class SpotifySkipTrackerGUI(ctk.CTk):
             logger.error("Error while terminating application: %s", e)
             sys.exit(1)
 
-    def _check_for_critical_errors(self) -> None:
+    def _wait_for_critical_error(self) -> None:
+        """
+        Block until a critical error is signalled, then notify the Tk main thread with
+        a <<CriticalError>> virtual event.
+        """
+        self._critical_error_event.wait()
+        try:
+            self.event_generate("<<CriticalError>>", when="tail")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to signal critical error: %s", e)
+
+    def _handle_critical_error(self, _: Any = None) -> None:
         """
-        Periodically check if a critical error has been signaled and terminate the app if so.
+        Show the signalled critical error to the user and terminate the app.
+
+        Args:
+            _ (Any, optional): The <<CriticalError>> event. Defaults to None.
         """
         if self._critical_error_event.is_set():
             if not self._error_message:
                 try:
-                    with open(
-                        "logs/spotify_app.log", "r", encoding="utf-8"
-                    ) as log_file:
-                        lines = log_file.readlines()
-                    for line in reversed(lines):
-                        if (
-                            " - CRITICAL - PlaybackMonitor encountered a critical error: "
-                            in line
-                        ):
-                            # Extract the actual error message after the last colon
-                            error_part = line.split(":")[-1].strip()
-                            self._error_message = error_part
-                            break
+                    # The error was just logged, so only the end of the log is read
+                    with open(self._tabs.log.log_file_path, "rb") as log_file:
+                        log_file.seek(0, os.SEEK_END)
+                        log_file.seek(
+                            max(0, log_file.tell() - _CRITICAL_ERROR_TAIL_SIZE)
+                        )
+                        tail: bytes = log_file.read()
+                    marker_index: int = tail.rfind(_CRITICAL_ERROR_MARKER)
+                    if marker_index >= 0:
+                        line_end: int = tail.find(b"\n", marker_index)
+                        line: bytes = tail[
+                            marker_index : line_end if line_end >= 0 else len(tail)
+                        ]
+                        # Extract the actual error message after the last colon
+                        self._error_message = (
+                            line.rsplit(b":", 1)[-1].strip().decode("utf-8", "replace")
+                        )
                     if not self._error_message:
                         self._error_message = "An unknown critical error has occurred."
                 except Exception as e:  # pylint: disable=broad-exception-caught
@@ -658,12 +1243,12 @@ class SpotifySkipTrackerGUI(ctk.CTk):
                 justify="center",
             ).get()
             self.terminate_application()
-        else:
-            # Schedule the next check after 1000 ms (1 second)
-            self.after(1000, self._check_for_critical_errors)
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """
+    Run the Spotify Skip Tracker GUI application.
+    """
     try:
         app = SpotifySkipTrackerGUI()
         app.mainloop()
@@ -677,3 +1262,7 @@ if __name__ == "__main__":
             justify="center",
         ).get()
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
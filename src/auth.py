@@ -9,11 +9,17 @@ such as client ID, client secret, and tokens.
 # pylint: disable=global-variable-not-assigned
 
 import logging
+import time
 from typing import Optional, Any, Dict
 import threading
 import requests
 from flask import Blueprint, request, redirect, jsonify
-from config_utils import set_config_variable, get_config_variable
+from http_utils import SPOTIFY_SESSION
+from config_utils import (
+    ENCRYPTED_KEYS,
+    get_config_variable,
+    set_config_variables,
+)
 
 # Define a global stop flag
 stop_flag: threading.Event = threading.Event()
@@ -61,6 +67,27 @@ except Exception as e:  # pylint: disable=broad-exception-caught
     _logger.critical("Failed to initialize tokens: %s", e)
     raise
 
+
+def _load_token_expiry() -> Optional[float]:
+    """
+    Load the stored access token expiry time from the config file.
+
+    Returns:
+        Optional[float]: The expiry time, or None if it is not stored.
+    """
+    try:
+        return float(get_config_variable("SPOTIFY_TOKEN_EXPIRES_AT", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+# Time (as returned by time.time()) at which the access token expires, if known
+_TOKEN_EXPIRES_AT: Optional[float] = _load_token_expiry()
+# Seconds before expiry at which the access token is refreshed proactively
+_TOKEN_REFRESH_MARGIN: float = 300.0
+# Seconds before expiry after which the access token is validated with Spotify
+_TOKEN_VALIDITY_MARGIN: float = 60.0
+
 # Define Flask Blueprints
 login_bp: Blueprint = Blueprint("login", __name__)
 callback_bp: Blueprint = Blueprint("callback", __name__)
@@ -120,21 +147,24 @@ def oauth_callback() -> Any:
                 "Content-Type": "application/x-www-form-urlencoded"
             }
             try:
-                response: requests.Response = requests.post(
+                response: requests.Response = SPOTIFY_SESSION.post(
                     _TOKEN_URL, data=payload, headers=headers, timeout=10
                 )
                 response.raise_for_status()  # Raise an error for bad responses
                 tokens: Dict[str, Any] = response.json()
                 _ACCESS_TOKEN = tokens.get("access_token")
                 _REFRESH_TOKEN = tokens.get("refresh_token")
+                _record_token_expiry(tokens)
 
                 # Save tokens to config.json
                 try:
-                    set_config_variable(
-                        "SPOTIFY_ACCESS_TOKEN", _ACCESS_TOKEN, encrypt=True
-                    )
-                    set_config_variable(
-                        "SPOTIFY_REFRESH_TOKEN", _REFRESH_TOKEN, encrypt=True
+                    set_config_variables(
+                        {
+                            "SPOTIFY_ACCESS_TOKEN": _ACCESS_TOKEN,
+                            "SPOTIFY_REFRESH_TOKEN": _REFRESH_TOKEN,
+                            "SPOTIFY_TOKEN_EXPIRES_AT": _TOKEN_EXPIRES_AT,
+                        },
+                        encrypt_keys=ENCRYPTED_KEYS,
                     )
                     _logger.info("Authentication successful.")
                 except Exception as e:  # pylint: disable=broad-exception-caught
@@ -176,14 +206,25 @@ def is_token_valid() -> bool:
     """
     Check if the current access token is valid.
 
+    A token whose stored expiry time has not been reached is trusted without
+    contacting Spotify.
+
     Returns:
         bool: True if valid, False otherwise.
     """
     try:
+        if (
+            _ACCESS_TOKEN
+            and _TOKEN_EXPIRES_AT is not None
+            and time.time() < _TOKEN_EXPIRES_AT - _TOKEN_VALIDITY_MARGIN
+        ):
+            _logger.debug("Access token has not expired; skipping validation.")
+            return True
+
         _auth_reload()
         headers: Dict[str, str] = {"Authorization": f"Bearer {_ACCESS_TOKEN}"}
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = SPOTIFY_SESSION.get(
                 "https://api.spotify.com/v1/me", headers=headers, timeout=10
             )
         except requests.exceptions.RequestException as e:
@@ -200,7 +241,7 @@ def is_token_valid() -> bool:
                 refresh_access_token()
                 headers = {"Authorization": f"Bearer {_ACCESS_TOKEN}"}
                 try:
-                    response = requests.get(
+                    response = SPOTIFY_SESSION.get(
                         "https://api.spotify.com/v1/me", headers=headers, timeout=10
                     )
                 except requests.exceptions.RequestException as e:
@@ -219,9 +260,17 @@ def is_token_valid() -> bool:
         raise
 
 
-def refresh_access_token() -> None:
+def refresh_access_token(cancelled: Optional[threading.Event] = None) -> bool:
     """
     Refresh the Spotify access token using the refresh token.
+
+    Args:
+        cancelled (Optional[threading.Event], optional): An event that, once set,
+            stops a new access token from being stored, such as when the user logs
+            out while the refresh is in flight. Defaults to None.
+
+    Returns:
+        bool: True if a new access token was obtained, False otherwise.
     """
     try:
         _auth_reload()
@@ -235,17 +284,29 @@ def refresh_access_token() -> None:
         }
         headers: Dict[str, str] = {"Content-Type": "application/x-www-form-urlencoded"}
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = SPOTIFY_SESSION.post(
                 _TOKEN_URL, data=payload, headers=headers, timeout=10
             )
             response.raise_for_status()
             tokens: Dict[str, Any] = response.json()
+            if cancelled is not None and cancelled.is_set():
+                _logger.debug("Access token refresh cancelled; discarding new token.")
+                return False
             _ACCESS_TOKEN = tokens.get("access_token")
-            set_config_variable("SPOTIFY_ACCESS_TOKEN", _ACCESS_TOKEN, encrypt=True)
+            _record_token_expiry(tokens)
+            set_config_variables(
+                {
+                    "SPOTIFY_ACCESS_TOKEN": _ACCESS_TOKEN,
+                    "SPOTIFY_TOKEN_EXPIRES_AT": _TOKEN_EXPIRES_AT,
+                },
+                encrypt_keys=ENCRYPTED_KEYS,
+            )
             _auth_reload()
             _logger.debug("Access Token Refreshed")
+            return bool(_ACCESS_TOKEN)
         except requests.exceptions.RequestException as e:
             _logger.error("Failed to refresh access token: %s", e)
+            return False
         except Exception as e:  # pylint: disable=broad-exception-caught
             _logger.critical("Unexpected error while refreshing access token: %s", e)
             raise
@@ -254,6 +315,52 @@ def refresh_access_token() -> None:
         raise
 
 
+def clear_tokens() -> None:
+    """
+    Forget the access and refresh tokens and their expiry, in memory and in the
+    config file.
+    """
+    global _ACCESS_TOKEN, _REFRESH_TOKEN, _TOKEN_EXPIRES_AT  # pylint: disable=global-statement
+    _ACCESS_TOKEN = ""
+    _REFRESH_TOKEN = ""
+    _TOKEN_EXPIRES_AT = None
+    set_config_variables(
+        {
+            "SPOTIFY_ACCESS_TOKEN": "",
+            "SPOTIFY_REFRESH_TOKEN": "",
+            "SPOTIFY_TOKEN_EXPIRES_AT": "",
+        },
+        encrypt_keys=ENCRYPTED_KEYS,
+    )
+
+
+def _record_token_expiry(tokens: Dict[str, Any]) -> None:
+    """
+    Record when the access token from a token response expires.
+
+    Args:
+        tokens (Dict[str, Any]): The token response from Spotify.
+    """
+    global _TOKEN_EXPIRES_AT  # pylint: disable=global-statement
+    try:
+        _TOKEN_EXPIRES_AT = time.time() + float(tokens["expires_in"])
+    except (KeyError, TypeError, ValueError):
+        _TOKEN_EXPIRES_AT = None
+
+
+def seconds_until_token_refresh() -> float:
+    """
+    Get the number of seconds until the access token should be refreshed.
+
+    Returns:
+        float: Seconds until the token is within the refresh margin of expiring, or
+            0.0 if it already is or its expiry is unknown.
+    """
+    if _TOKEN_EXPIRES_AT is None:
+        return 0.0
+    return max(0.0, _TOKEN_EXPIRES_AT - time.time() - _TOKEN_REFRESH_MARGIN)
+
+
 def _shutdown_flask_server() -> None:
     """
     Signal the Flask server to shut down.
@@ -2,12 +2,17 @@
 This module provides functions to load, save, and manage configuration settings.
 """
 
+import copy
+import functools
 import json
 import os
 import logging
-from typing import Any, Dict, Optional, Union
-from cryptography.fernet import Fernet
-from dotenv import load_dotenv, set_key
+import threading
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, Optional, Union
+from json_utils import load_json_file, write_json_file_atomic  # pylint: disable=import-error
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
 
 _CONFIG_FILE: str = "config.json"
 _ENV_FILE: str = ".env"
@@ -21,12 +26,44 @@ _REQUIRED_KEYS: list[str] = [
     "SPOTIFY_ACCESS_TOKEN",
     "SPOTIFY_REFRESH_TOKEN",
 ]
+_REQUIRED_KEYS_SET: frozenset[str] = frozenset(_REQUIRED_KEYS)
+
+# Configuration keys whose values are always stored encrypted
+ENCRYPTED_KEYS: frozenset[str] = frozenset(
+    {
+        "SPOTIFY_CLIENT_ID",
+        "SPOTIFY_CLIENT_SECRET",
+        "SPOTIFY_ACCESS_TOKEN",
+        "SPOTIFY_REFRESH_TOKEN",
+    }
+)
+
+# Parsed configuration cached against the file's modification time and size
+_CONFIG_CACHE: Optional[Dict[str, Any]] = None
+_CONFIG_MTIME: int = -1
+_CONFIG_SIZE: int = -1
+_CONFIG_LOCK: threading.RLock = threading.RLock()
+
+_ENV_LOADED: bool = False
+
+
+def _ensure_env_loaded() -> None:
+    """
+    Load environment variables from the .env file once, unless the encryption key
+    is already present in the environment.
+    """
+    global _ENV_LOADED  # pylint: disable=global-statement
+    if _ENV_LOADED:
+        return
+    if not os.environ.get("ENCRYPTION_KEY"):
+        from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
 
-# Load environment variables
-load_dotenv(_ENV_FILE)
+        load_dotenv(_ENV_FILE)
+    _ENV_LOADED = True
 
 
 # Retrieve or generate the encryption key
+@functools.lru_cache(maxsize=None)
 def _get_encryption_key() -> bytes:
     """
     Retrieve the encryption key from the environment or generate a new one if it does not exist.
@@ -35,8 +72,12 @@ def _get_encryption_key() -> bytes:
         bytes: The encryption key.
     """
     try:
+        _ensure_env_loaded()
         key: Optional[str] = os.getenv("ENCRYPTION_KEY")
         if not key:
+            from cryptography.fernet import Fernet  # pylint: disable=import-outside-toplevel
+            from dotenv import set_key  # pylint: disable=import-outside-toplevel
+
             key = Fernet.generate_key().decode()
             try:
                 set_key(_ENV_FILE, "ENCRYPTION_KEY", key)
@@ -57,8 +98,42 @@ def _get_encryption_key() -> bytes:
         raise
 
 
-_ENCRYPTION_KEY: bytes = _get_encryption_key()
 _ENCRYPTION_PREFIX: str = "enc:"
+_ENCRYPTION_PREFIX_LEN: int = len(_ENCRYPTION_PREFIX)
+_FERNET: Optional["Fernet"] = None
+
+
+def _get_fernet() -> "Fernet":
+    """
+    Return the shared Fernet instance, importing cryptography and building the
+    instance from the encryption key on first use.
+
+    Returns:
+        Fernet: The Fernet instance used to encrypt and decrypt configuration values.
+    """
+    global _FERNET  # pylint: disable=global-statement
+    if _FERNET is None:
+        from cryptography.fernet import Fernet  # pylint: disable=import-outside-toplevel
+
+        _FERNET = Fernet(_get_encryption_key())
+    return _FERNET
+
+
+@functools.lru_cache(maxsize=32)
+def _decrypt_token(token: str) -> str:
+    """
+    Decrypt a Fernet token, memoizing the result.
+
+    Fernet tokens are unique per encryption, so a changed value never hits a
+    stale entry, and unchanged values are only decrypted once.
+
+    Args:
+        token (str): The Fernet token, without the encryption prefix.
+
+    Returns:
+        str: Decrypted data.
+    """
+    return _get_fernet().decrypt(token.encode()).decode()
 
 
 def _encrypt_data(data: Union[str, int, float, None]) -> str:
@@ -76,7 +151,7 @@ def _encrypt_data(data: Union[str, int, float, None]) -> str:
             return ""
         if isinstance(data, (int, float)):
             data = str(data)
-        fernet: Fernet = Fernet(_ENCRYPTION_KEY)
+        fernet: "Fernet" = _get_fernet()
         encrypted_data: bytes = fernet.encrypt(data.encode())
         return _ENCRYPTION_PREFIX + encrypted_data.decode()
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -97,10 +172,7 @@ def _decrypt_data(encrypted_data: str) -> str:
     try:
         if not encrypted_data.startswith(_ENCRYPTION_PREFIX):
             return encrypted_data
-        encrypted_data = encrypted_data[len(_ENCRYPTION_PREFIX) :]
-        fernet: Fernet = Fernet(_ENCRYPTION_KEY)
-        decrypted_data: bytes = fernet.decrypt(encrypted_data.encode())
-        return decrypted_data.decode()
+        return _decrypt_token(encrypted_data[_ENCRYPTION_PREFIX_LEN:])
     except (ValueError, TypeError) as e:
         logger.error("Decryption failed for data: %s", e)
         return ""  # Return empty string or handle as needed
@@ -109,21 +181,28 @@ def _decrypt_data(encrypted_data: str) -> str:
         raise
 
 
-def load_config(decrypt: bool = False) -> Dict[str, Any]:
+def load_config(
+    decrypt: bool = False, persist_defaults: bool = False
+) -> Dict[str, Any]:
     """
     Load configuration from the JSON file. If the file does not exist,
     create it with required keys initialized to empty strings.
 
+    The parsed file is cached and only re-read when its modification time or
+    size changes.
+
     Args:
         decrypt (bool, optional): Whether to attempt to decrypt the configuration values.
             Defaults to False.
+        persist_defaults (bool, optional): Whether to save the configuration file when
+            missing required keys are added. Defaults to False.
 
     Returns:
         Dict[str, Any]: Configuration data.
     """
     try:
         config = _load_or_create_config()
-        _ensure_required_keys(config)
+        _ensure_required_keys(config, persist=persist_defaults)
         if decrypt:
             _decrypt_config_values(config)
         return config
@@ -137,14 +216,40 @@ def _load_or_create_config() -> Dict[str, Any]:
     Load the configuration from the JSON file, or create a new one if it doesn't exist.
 
     Returns:
-        Dict[str, Any]: The loaded or newly created configuration data.
+        Dict[str, Any]: A copy of the loaded or newly created configuration data.
+    """
+    with _CONFIG_LOCK:
+        return copy.deepcopy(_get_cached_config())
+
+
+def _get_cached_config() -> Dict[str, Any]:
+    """
+    Return the shared parsed configuration, re-reading the JSON file only when its
+    modification time or size has changed. Creates the file if it doesn't exist.
+
+    The returned dictionary is the cache itself; callers must hold _CONFIG_LOCK and
+    only mutate it when the result is persisted with save_config.
+
+    Returns:
+        Dict[str, Any]: The cached configuration data.
     """
+    global _CONFIG_CACHE, _CONFIG_MTIME, _CONFIG_SIZE  # pylint: disable=global-statement
     if not os.path.exists(_CONFIG_FILE):
         logger.info("%s not found. Creating a new one with empty values.", _CONFIG_FILE)
         return _create_default_config()
     try:
-        with open(_CONFIG_FILE, "r", encoding="utf-8") as file:
-            return json.load(file)
+        stat_result: os.stat_result = os.stat(_CONFIG_FILE)
+        if (
+            _CONFIG_CACHE is not None
+            and stat_result.st_mtime_ns == _CONFIG_MTIME
+            and stat_result.st_size == _CONFIG_SIZE
+        ):
+            return _CONFIG_CACHE
+        config: Dict[str, Any] = load_json_file(_CONFIG_FILE)
+        _CONFIG_CACHE = config
+        _CONFIG_MTIME = stat_result.st_mtime_ns
+        _CONFIG_SIZE = stat_result.st_size
+        return config
     except json.JSONDecodeError as e:
         logger.error("Error decoding %s: %s", _CONFIG_FILE, e)
         return _create_default_config()
@@ -153,26 +258,32 @@ def _load_or_create_config() -> Dict[str, Any]:
         raise
 
 
-def _ensure_required_keys(config: Dict[str, Any]) -> None:
+def _ensure_required_keys(config: Dict[str, Any], persist: bool = False) -> None:
     """
     Ensure that all required keys are present in the configuration.
 
     Args:
         config (Dict[str, Any]): The configuration data to check and update.
+        persist (bool, optional): Whether to save the configuration file when keys
+            are added. Defaults to False.
     """
-    missing_keys: list[str] = [key for key in _REQUIRED_KEYS if key not in config]
-    if missing_keys:
-        logger.info(
-            "Missing keys in config: %s. Adding them with empty values.", missing_keys
-        )
-        for key in missing_keys:
-            config[key] = ""
-        try:
-            save_config(config)
-            logger.debug("Missing keys added to config: %s.", missing_keys)
-        except Exception as e:
-            logger.critical("Failed to save config after adding missing keys: %s", e)
-            raise
+    missing_keys: frozenset[str] = _REQUIRED_KEYS_SET.difference(config)
+    if not missing_keys:
+        return
+    logger.info(
+        "Missing keys in config: %s. Adding them with empty values.",
+        sorted(missing_keys),
+    )
+    for key in missing_keys:
+        config[key] = ""
+    if not persist:
+        return
+    try:
+        save_config(config)
+        logger.debug("Missing keys added to config: %s.", sorted(missing_keys))
+    except Exception as e:
+        logger.critical("Failed to save config after adding missing keys: %s", e)
+        raise
 
 
 def _decrypt_config_values(config: Dict[str, Any]) -> None:
@@ -183,11 +294,13 @@ def _decrypt_config_values(config: Dict[str, Any]) -> None:
         config (Dict[str, Any]): The configuration data containing potentially encrypted values.
     """
     for key in _REQUIRED_KEYS:
-        if key in config and config[key].startswith(_ENCRYPTION_PREFIX):
-            try:
-                config[key] = _decrypt_data(config[key])
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error("Failed to decrypt key %s: %s", key, e)
+        value: Any = config.get(key)
+        if not isinstance(value, str) or not value.startswith(_ENCRYPTION_PREFIX):
+            continue
+        try:
+            config[key] = _decrypt_token(value[_ENCRYPTION_PREFIX_LEN:])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to decrypt key %s: %s", key, e)
 
 
 def _create_default_config() -> Dict[str, Any]:
@@ -214,15 +327,18 @@ def save_config(config: Dict[str, Any]) -> None:
     Args:
         config (Dict[str, Any]): Configuration data to save.
     """
+    global _CONFIG_MTIME  # pylint: disable=global-statement
     try:
-        with open(_CONFIG_FILE, "w", encoding="utf-8") as file:
-            json.dump(config, file, indent=4)
+        write_json_file_atomic(_CONFIG_FILE, config)
         logger.debug("Configuration saved successfully to %s.", _CONFIG_FILE)
     except (OSError, IOError) as e:
         logger.error("Failed to save configuration: %s", e)
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.critical("Unexpected error while saving configuration: %s", e)
         raise
+    finally:
+        # Force the next load to re-read the file we just wrote
+        _CONFIG_MTIME = -1
 
 
 def set_config_variable(
@@ -237,29 +353,33 @@ def set_config_variable(
         encrypt (bool, optional): Whether to encrypt the value. Defaults to False.
     """
     try:
-        config: Dict[str, Any] = load_config()
-        old_value: Any = config.get(key, "")
-        if encrypt:
-            try:
-                value = _encrypt_data(value)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error("Failed to encrypt value for key %s: %s", key, e)
-                return  # Exit the function if encryption fails
-
-        if old_value != value:
-            config[key] = value
-            try:
-                save_config(config)
-                logger.debug(
-                    "Configuration key '%s' changed and saved to %s.",
-                    key,
-                    _CONFIG_FILE,
-                )
-            except Exception as e:
-                logger.critical(
-                    "Failed to save configuration after setting key '%s': %s", key, e
-                )
-                raise
+        with _CONFIG_LOCK:
+            config: Dict[str, Any] = _get_cached_config()
+            _ensure_required_keys(config, persist=True)
+            old_value: Any = config.get(key, "")
+            if encrypt:
+                try:
+                    value = _encrypt_data(value)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("Failed to encrypt value for key %s: %s", key, e)
+                    return  # Exit the function if encryption fails
+
+            if old_value != value:
+                config[key] = value
+                try:
+                    save_config(config)
+                    logger.debug(
+                        "Configuration key '%s' changed and saved to %s.",
+                        key,
+                        _CONFIG_FILE,
+                    )
+                except Exception as e:
+                    logger.critical(
+                        "Failed to save configuration after setting key '%s': %s",
+                        key,
+                        e,
+                    )
+                    raise
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.critical(
             "Critical failure in set_config_variable for key '%s': %s", key, e
@@ -267,6 +387,61 @@ def set_config_variable(
         raise
 
 
+def set_config_variables(
+    values: Dict[str, Union[str, int, float, None]],
+    encrypt_keys: AbstractSet[str] = ENCRYPTED_KEYS,
+) -> None:
+    """
+    Set several configuration variables and save them with a single write.
+
+    Args:
+        values (Dict[str, Union[str, int, float, None]]): Configuration keys and values.
+        encrypt_keys (AbstractSet[str], optional): Keys whose values should be
+            encrypted. Defaults to ENCRYPTED_KEYS.
+    """
+    try:
+        with _CONFIG_LOCK:
+            config: Dict[str, Any] = _get_cached_config()
+            _ensure_required_keys(config, persist=True)
+            updates: Dict[str, Any] = {}
+            for key, value in values.items():
+                if key in encrypt_keys:
+                    try:
+                        value = _encrypt_data(value)
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.error("Failed to encrypt value for key %s: %s", key, e)
+                        return  # Write nothing if any value cannot be encrypted
+                updates[key] = value
+
+            changed: list[str] = [
+                key for key, value in updates.items() if config.get(key, "") != value
+            ]
+            if changed:
+                for key in changed:
+                    config[key] = updates[key]
+                try:
+                    save_config(config)
+                    logger.debug(
+                        "Configuration keys %s changed and saved to %s.",
+                        changed,
+                        _CONFIG_FILE,
+                    )
+                except Exception as e:
+                    logger.critical(
+                        "Failed to save configuration after setting keys %s: %s",
+                        changed,
+                        e,
+                    )
+                    raise
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.critical(
+            "Critical failure in set_config_variables for keys %s: %s",
+            list(values),
+            e,
+        )
+        raise
+
+
 def get_config_variable(key: str, default: str = "", decrypt: bool = False) -> str:
     """
     Retrieve a configuration variable, optionally decrypting the value.
@@ -280,8 +455,8 @@ def get_config_variable(key: str, default: str = "", decrypt: bool = False) -> s
         str: Configuration value.
     """
     try:
-        config: Dict[str, Any] = load_config()
-        value: Any = config.get(key, default)
+        with _CONFIG_LOCK:
+            value: Any = _get_cached_config().get(key, default)
         if decrypt and value:
             try:
                 value = _decrypt_data(value)
@@ -3,25 +3,82 @@ This module defines the HomeTab class for the Spotify Skip Tracker GUI.
 It provides functionality to display playback information and logs.
 """
 
+import hashlib
 import io
+import os
 import threading
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 import customtkinter as ctk
 from PIL import Image, ImageOps, ImageDraw
 import requests
-from customtkinter import CTkImage, get_appearance_mode
+from customtkinter import AppearanceModeTracker, CTkImage, get_appearance_mode
 from CTkMessagebox import CTkMessagebox
+from http_utils import ALBUM_ART_SESSION  # pylint: disable=import-error
 from utils import resource_path  # pylint: disable=import-error
 
+_ALBUM_ART_CACHE_DIR: str = os.path.join("cache", "album_art")
+_ALBUM_ART_MEMORY_CACHE_SIZE: int = 64
+# Maximum number of album art images kept on disk; the least recently used are
+# removed first
+_ALBUM_ART_DISK_CACHE_SIZE: int = 500
+# Width and height, in pixels, at which album art is displayed
+_ALBUM_ART_SIZE: int = 200
+# Progress changes smaller than one pixel of the progress bar are not redrawn
+_PROGRESS_MIN_DELTA: float = 1 / 420
+
+
+def _load_placeholder_image(relative_path: str) -> Image.Image:
+    """
+    Open and fully decode a placeholder image.
+
+    Args:
+        relative_path (str): Path to the image relative to the application resources.
+
+    Returns:
+        Image.Image: The decoded image.
+    """
+    with Image.open(resource_path(relative_path)) as image:
+        image.load()
+        return image.copy()
+
+
+# Placeholder album art is decoded once at import and shared by every HomeTab
+_PLACEHOLDER_LIGHT: Image.Image = _load_placeholder_image("assets/images/black.jpg")
+_PLACEHOLDER_DARK: Image.Image = _load_placeholder_image("assets/images/white.jpg")
+
+# Text color for the current appearance mode, reset when the appearance mode changes
+_TEXT_COLOR_CACHE: Dict[str, Optional[str]] = {"color": None}
+
+
+def _invalidate_text_color(_: str) -> None:
+    """
+    Reset the cached text color when the appearance mode changes.
+
+    Args:
+        _ (str): The new appearance mode.
+    """
+    _TEXT_COLOR_CACHE["color"] = None
+
 
 def get_text_color() -> str:
     """
     Determine the text color based on the current appearance mode.
 
+    The result is cached until customtkinter reports an appearance mode change.
+
     Returns:
         str: "black" if in Dark mode, otherwise "white".
     """
-    return "black" if get_appearance_mode() == "Dark" else "white"
+    color: Optional[str] = _TEXT_COLOR_CACHE["color"]
+    if color is None:
+        color = "black" if get_appearance_mode() == "Dark" else "white"
+        _TEXT_COLOR_CACHE["color"] = color
+    return color
+
+
+AppearanceModeTracker.add(_invalidate_text_color)
 
 
 class HomeTab:
@@ -53,8 +110,8 @@ class HomeTab:
         """Initialize the placeholder image."""
         try:
             self._placeholder_image: CTkImage = CTkImage(
-                light_image=Image.open(resource_path("assets/images/black.jpg")),
-                dark_image=Image.open(resource_path("assets/images/white.jpg")),
+                light_image=_PLACEHOLDER_LIGHT,
+                dark_image=_PLACEHOLDER_DARK,
                 size=(200, 200),
             )
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -235,8 +292,34 @@ class HomeTab:
         """Initialize dynamic variables."""
         try:
             self._dynamic_vars: Dict[str, Any] = {}
-            self._dynamic_vars["album_art_image"] = self._placeholder_image
+            # Single image reused for all album art; its source image is swapped
+            # in place so the label keeps the same image object
+            self._dynamic_vars["album_art_image"] = CTkImage(
+                light_image=_PLACEHOLDER_LIGHT,
+                dark_image=_PLACEHOLDER_DARK,
+                size=(200, 200),
+            )
+            self._dynamic_vars["album_art_shown"] = False
             self._dynamic_vars["current_album_art_url"] = None
+            # Last text rendered into each playback label, used to skip redundant reflows
+            self._dynamic_vars["rendered_text"] = {}
+            self._dynamic_vars["rendered_progress"] = 0.0
+            # Whether the playback widgets currently show the cleared state
+            self._dynamic_vars["playback_cleared"] = False
+            # Label texts and duration of the current track, which stay the same
+            # for every playback update while the track is playing
+            self._dynamic_vars["track_cache"] = {"id": None}
+            # Number of complete lines currently shown in the log text box
+            self._dynamic_vars["log_line_count"] = 0
+            # Most recently used album art images keyed by the SHA-1 of their URL
+            self._dynamic_vars["album_art_cache"] = OrderedDict()
+            self._dynamic_vars["album_art_cache_lock"] = threading.Lock()
+            # Incremented per album art request so stale downloads are discarded
+            self._dynamic_vars["album_art_generation"] = 0
+            self._dynamic_vars["album_art_executor"] = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="AlbumArt"
+            )
+            os.makedirs(_ALBUM_ART_CACHE_DIR, exist_ok=True)
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to initialize dynamic variables: %s", e)
 
@@ -252,6 +335,7 @@ class HomeTab:
         """
         try:
             if playback:
+                self._dynamic_vars["playback_cleared"] = False
                 # Check if the playback is from the user's Liked Songs collection
                 context_uri = playback.get("context", {}).get("uri", "")
                 if context_uri != f"spotify:user:{user_id}:collection":
@@ -270,16 +354,18 @@ class HomeTab:
 
     def _show_playlist_notice(self) -> None:
         """Display a notice that the Liked Songs Playlist is not being played."""
-        self._ui_elements["playlist_notice"].configure(
-            text=(
-                "Notice: You are not playing from your Liked Songs Playlist. "
-                "Skips will not be tracked."
-            )
+        self._set_label_text(
+            "playlist_notice",
+            self._ui_elements["playlist_notice"],
+            "Notice: You are not playing from your Liked Songs Playlist. "
+            "Skips will not be tracked.",
         )
 
     def _hide_playlist_notice(self) -> None:
         """Hide the playlist notice by setting its text to an empty string."""
-        self._ui_elements["playlist_notice"].configure(text="")
+        self._set_label_text(
+            "playlist_notice", self._ui_elements["playlist_notice"], ""
+        )
 
     def _truncate_text(self, text: str, max_length: int = 30) -> str:
         """
@@ -302,30 +388,49 @@ class HomeTab:
             playback (Dict[str, Any]): The current playback information.
         """
         try:
-            track_name: str = playback["item"]["name"]
-            artists: str = ", ".join(
-                [artist["name"] for artist in playback["item"]["artists"]]
-            )
+            track_cache: Dict[str, Any] = self._get_track_cache(playback["item"])
             is_playing: bool = playback["is_playing"]
             status: str = "Playing" if is_playing else "Paused"
 
-            truncated_track_name = self._truncate_text(track_name)
-            truncated_artists = self._truncate_text(artists)
-
-            self._ui_elements["track_info_labels"]["track_name"].configure(
-                text=f"Track: {truncated_track_name}"
-            )
-            self._ui_elements["track_info_labels"]["artists"].configure(
-                text=f"Artists: {truncated_artists}"
-            )
-            self._ui_elements["track_info_labels"]["status"].configure(
-                text=f"Status: {status}"
+            labels: Dict[str, ctk.CTkLabel] = self._ui_elements["track_info_labels"]
+            self._set_label_text(
+                "track_name", labels["track_name"], track_cache["track_name"]
             )
+            self._set_label_text("artists", labels["artists"], track_cache["artists"])
+            self._set_label_text("status", labels["status"], f"Status: {status}")
         except KeyError as e:
             self.logger.error("Track info label not found: %s", e)
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to update track info labels: %s", e)
 
+    def _get_track_cache(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the label texts and duration of a track, building them only when the
+        track changes.
+
+        Args:
+            item (Dict[str, Any]): The currently playing track.
+
+        Returns:
+            Dict[str, Any]: The track's ID, track name and artists label texts,
+                duration in seconds, and formatted duration.
+        """
+        track_cache: Dict[str, Any] = self._dynamic_vars["track_cache"]
+        track_id: Optional[str] = item.get("id")
+        # Local files have no ID, so they are rebuilt on every update
+        if track_id is None or track_cache["id"] != track_id:
+            artists: str = ", ".join(artist["name"] for artist in item["artists"])
+            duration: int = item["duration_ms"] // 1000
+            track_cache = {
+                "id": track_id,
+                "track_name": f"Track: {self._truncate_text(item['name'])}",
+                "artists": f"Artists: {self._truncate_text(artists)}",
+                "duration": duration,
+                "duration_text": self._format_time(duration),
+            }
+            self._dynamic_vars["track_cache"] = track_cache
+        return track_cache
+
     def _update_progress_bar(self, playback: Dict[str, Any]) -> None:
         """
         Update the progress bar and time label with the current playback information.
@@ -334,16 +439,38 @@ class HomeTab:
             playback (Dict[str, Any]): The current playback information.
         """
         try:
+            track_cache: Dict[str, Any] = self._get_track_cache(playback["item"])
             progress: int = playback["progress_ms"] // 1000
-            duration: int = playback["item"]["duration_ms"] // 1000
+            duration: int = track_cache["duration"]
             progress_percentage: float = (progress / duration) if duration > 0 else 0.0
-            self._ui_elements["progress"]["var"].set(progress_percentage)
-            self._ui_elements["progress"]["time_label"].configure(
-                text=f"{self._format_time(progress)} / {self._format_time(duration)}"
+            if (
+                abs(progress_percentage - self._dynamic_vars["rendered_progress"])
+                >= _PROGRESS_MIN_DELTA
+            ):
+                self._ui_elements["progress"]["var"].set(progress_percentage)
+                self._dynamic_vars["rendered_progress"] = progress_percentage
+            self._set_label_text(
+                "time",
+                self._ui_elements["progress"]["time_label"],
+                f"{self._format_time(progress)} / {track_cache['duration_text']}",
             )
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to update progress bar or time label: %s", e)
 
+    def _set_label_text(self, key: str, label: ctk.CTkLabel, text: str) -> None:
+        """
+        Configure the text of a label only if it differs from the last rendered text.
+
+        Args:
+            key (str): The key under which the rendered text is remembered.
+            label (ctk.CTkLabel): The label to update.
+            text (str): The new label text.
+        """
+        rendered_text: Dict[str, str] = self._dynamic_vars["rendered_text"]
+        if rendered_text.get(key) != text:
+            label.configure(text=text)
+            rendered_text[key] = text
+
     def _update_album_art(self, playback: Dict[str, Any]) -> None:
         """
         Update the album art with the current playback information.
@@ -352,7 +479,9 @@ class HomeTab:
             playback (Dict[str, Any]): The current playback information.
         """
         try:
-            album_art_url: str = playback["item"]["album"]["images"][0]["url"]
+            album_art_url: str = self._select_album_art_url(
+                playback["item"]["album"]["images"]
+            )
             if (
                 not self._dynamic_vars["current_album_art_url"]
                 or self._dynamic_vars["current_album_art_url"] != album_art_url
@@ -364,10 +493,37 @@ class HomeTab:
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to update album art: %s", e)
 
+    @staticmethod
+    def _select_album_art_url(images: List[Dict[str, Any]]) -> str:
+        """
+        Select the smallest album art variant that still covers the displayed size.
+
+        Spotify lists album art in several sizes (typically 640, 300, and 64 px), so
+        downloading the 300 px variant avoids fetching and downscaling the largest.
+
+        Args:
+            images (List[Dict[str, Any]]): The album images from the playback data.
+
+        Returns:
+            str: URL of the selected image.
+        """
+        large_enough = [
+            image for image in images if (image.get("width") or 0) >= _ALBUM_ART_SIZE
+        ]
+        if large_enough:
+            return min(large_enough, key=lambda image: image["width"])["url"]
+        # Unknown or small sizes only; fall back to the first, largest, image
+        return images[0]["url"]
+
     def _clear_playback_information(self) -> None:
         """
         Clear the playback information in the Home tab.
+
+        The widgets are only reset once while nothing is playing, rather than on
+        every playback update.
         """
+        if self._dynamic_vars.get("playback_cleared"):
+            return
         try:
             self._ui_elements["playlist_notice"].configure(text="")
             self._ui_elements["track_info_labels"]["track_name"].configure(
@@ -379,12 +535,17 @@ class HomeTab:
             self._ui_elements["track_info_labels"]["status"].configure(text="Status: ")
             self._ui_elements["progress"]["var"].set(0.0)
             self._ui_elements["progress"]["time_label"].configure(text="0s / 0s")
+            self._dynamic_vars["rendered_text"].clear()
+            self._dynamic_vars["rendered_progress"] = 0.0
             self._ui_elements["album_art_label"].configure(
                 text="No Playback",
                 image=self._placeholder_image,
                 text_color=get_text_color(),
             )
+            self._dynamic_vars["album_art_shown"] = False
             self._dynamic_vars["current_album_art_url"] = None
+            self._dynamic_vars["album_art_generation"] += 1
+            self._dynamic_vars["playback_cleared"] = True
         except KeyError as e:
             self.logger.error("Playback UI element not found: %s", e)
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -401,11 +562,49 @@ class HomeTab:
             self._log_text.configure(state="normal")
             self._log_text.delete("1.0", "end")
             self._log_text.insert("1.0", log_contents)
+            self._dynamic_vars["log_line_count"] = log_contents.count("\n")
             self._log_text.yview_moveto(1.0)
             self._log_text.configure(state="disabled")
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to update logs: %s", e)
 
+    def append_logs(
+        self, log_contents: str, max_lines: int, reset: bool = False
+    ) -> None:
+        """
+        Append new log lines to the log text box, keeping at most max_lines lines.
+
+        The text box only scrolls to the new lines when it was already showing the
+        end of the log, so reading earlier lines is not interrupted.
+
+        Args:
+            log_contents (str): The new log lines to append.
+            max_lines (int): The maximum number of lines to keep in the text box.
+            reset (bool, optional): Whether to clear the text box first. Defaults to False.
+        """
+        try:
+            # Checked before inserting, as the new lines move the end of the view
+            follow: bool = reset or self._log_text.yview()[1] >= 0.99
+            self._log_text.configure(state="normal")
+            if reset:
+                self._log_text.delete("1.0", "end")
+                self._dynamic_vars["log_line_count"] = 0
+            self._log_text.insert("end", log_contents)
+
+            # Track the line count in Python so trimming needs no index query
+            line_count: int = self._dynamic_vars["log_line_count"]
+            line_count += log_contents.count("\n")
+            if line_count > max_lines:
+                self._log_text.delete("1.0", f"{line_count - max_lines + 1}.0")
+                line_count = max_lines
+            self._dynamic_vars["log_line_count"] = line_count
+
+            if follow:
+                self._log_text.yview_moveto(1.0)
+            self._log_text.configure(state="disabled")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.error("Failed to append logs: %s", e)
+
     def _format_time(self, seconds: int) -> str:
         """
         Format seconds into minutes and seconds.
@@ -421,42 +620,173 @@ class HomeTab:
         seconds = seconds % 60
         return f"{minutes}:{seconds:02d}"
 
-    def _load_album_art(self, url: str) -> None:
+    def _load_album_art(self, url: str, generation: int) -> None:
         """
         Load and display album art from a URL.
 
+        Processed images are cached in memory and on disk, keyed by the SHA-1 hash
+        of the URL, so replayed tracks skip the download and image processing.
+
         Args:
             url (str): URL of the album art image.
+            generation (int): The album art request generation this load belongs to.
         """
         try:
-            response: requests.Response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            image_data: bytes = response.content
-            image: Image.Image = Image.open(io.BytesIO(image_data))
-            image = image.resize((200, 200), Image.Resampling.LANCZOS)  # type: ignore
-
-            radius = 20
-            mask = Image.new("L", image.size, 0)
-            draw = ImageDraw.Draw(mask)
-            draw.rounded_rectangle((0, 0) + image.size, radius=radius, fill=255)
-            rounded_image = ImageOps.fit(image, mask.size, centering=(0.5, 0.5))
-            rounded_image.putalpha(mask)
+            key: str = hashlib.sha1(url.encode("utf-8")).hexdigest()
+            album_art: Optional[Image.Image] = self._get_cached_album_art(key)
+            if album_art is None:
+                album_art = self._read_album_art(url, key)
+                self._cache_album_art(key, album_art)
 
-            self._dynamic_vars["album_art_image"] = CTkImage(
-                rounded_image, size=(200, 200)
-            )
-            self._ui_elements["album_art_label"].configure(
-                text="", image=self._dynamic_vars["album_art_image"]
-            )
+            if generation != self._dynamic_vars["album_art_generation"]:
+                return
+            self.parent.after(0, self._show_album_art, album_art, generation)
         except requests.exceptions.RequestException as e:
             self.logger.error("Request failed while loading album art: %s", e)
-            self._ui_elements["album_art_label"].configure(image=None)
+            self.parent.after(0, self._show_album_art, None, generation)
         except IOError as e:
             self.logger.error("IO error while processing album art image: %s", e)
-            self._ui_elements["album_art_label"].configure(image=None)
+            self.parent.after(0, self._show_album_art, None, generation)
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to load album art: %s", e)
-            self._ui_elements["album_art_label"].configure(image=None)
+            self.parent.after(0, self._show_album_art, None, generation)
+
+    def _show_album_art(
+        self, album_art: Optional[Image.Image], generation: int
+    ) -> None:
+        """
+        Display album art in the album art label. Must run on the Tk main thread.
+
+        Args:
+            album_art (Optional[Image.Image]): The album art to display, or None to
+                remove the current image.
+            generation (int): The album art request generation the image belongs to.
+                Images from superseded requests are ignored.
+        """
+        try:
+            if generation != self._dynamic_vars["album_art_generation"]:
+                return
+            if album_art is None:
+                self._ui_elements["album_art_label"].configure(image=None)
+                self._dynamic_vars["album_art_shown"] = False
+                return
+
+            self._dynamic_vars["album_art_image"].configure(
+                light_image=album_art, dark_image=album_art
+            )
+            if not self._dynamic_vars["album_art_shown"]:
+                self._ui_elements["album_art_label"].configure(
+                    text="", image=self._dynamic_vars["album_art_image"]
+                )
+                self._dynamic_vars["album_art_shown"] = True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.error("Failed to display album art: %s", e)
+
+    def _get_cached_album_art(self, key: str) -> Optional[Image.Image]:
+        """
+        Look up album art in the in-memory cache.
+
+        Args:
+            key (str): The cache key of the album art.
+
+        Returns:
+            Optional[Image.Image]: The cached album art, or None if it is not cached.
+        """
+        with self._dynamic_vars["album_art_cache_lock"]:
+            cache: OrderedDict[str, Image.Image] = self._dynamic_vars["album_art_cache"]
+            album_art: Optional[Image.Image] = cache.get(key)
+            if album_art is not None:
+                cache.move_to_end(key)
+            return album_art
+
+    def _cache_album_art(self, key: str, album_art: Image.Image) -> None:
+        """
+        Store album art in the in-memory cache, evicting the least recently used entry.
+
+        Args:
+            key (str): The cache key of the album art.
+            album_art (Image.Image): The album art to cache.
+        """
+        with self._dynamic_vars["album_art_cache_lock"]:
+            cache: OrderedDict[str, Image.Image] = self._dynamic_vars["album_art_cache"]
+            cache[key] = album_art
+            cache.move_to_end(key)
+            if len(cache) > _ALBUM_ART_MEMORY_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _read_album_art(self, url: str, key: str) -> Image.Image:
+        """
+        Read processed album art from the disk cache, or download, process, and
+        cache it if it is not there.
+
+        Args:
+            url (str): URL of the album art image.
+            key (str): The cache key of the album art.
+
+        Returns:
+            Image.Image: The resized album art with rounded corners.
+        """
+        cache_path: str = os.path.join(_ALBUM_ART_CACHE_DIR, f"{key}.png")
+        try:
+            with Image.open(cache_path) as cached_image:
+                cached_image.load()
+                album_art: Image.Image = cached_image.copy()
+            try:
+                # Mark the image as recently used for disk cache eviction
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return album_art
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            self.logger.debug("Ignoring unreadable cached album art %s: %s", key, e)
+
+        response: requests.Response = ALBUM_ART_SESSION.get(url, timeout=5)
+        response.raise_for_status()
+        image: Image.Image = Image.open(io.BytesIO(response.content))
+        # thumbnail lets the JPEG decoder downscale while decoding, and BILINEAR is
+        # indistinguishable from LANCZOS at this display size
+        image.thumbnail((200, 200), Image.Resampling.BILINEAR)
+
+        radius = 20
+        mask = Image.new("L", (200, 200), 0)
+        draw = ImageDraw.Draw(mask)
+        draw.rounded_rectangle((0, 0) + mask.size, radius=radius, fill=255)
+        rounded_image = ImageOps.fit(
+            image, mask.size, Image.Resampling.BILINEAR, centering=(0.5, 0.5)
+        )
+        rounded_image.putalpha(mask)
+
+        try:
+            rounded_image.save(cache_path, format="PNG")
+            self._prune_album_art_disk_cache()
+        except (OSError, IOError) as e:
+            self.logger.debug("Failed to cache album art %s on disk: %s", key, e)
+        return rounded_image
+
+    def _prune_album_art_disk_cache(self) -> None:
+        """
+        Remove the least recently used album art from the disk cache once it holds
+        more than _ALBUM_ART_DISK_CACHE_SIZE images.
+        """
+        with os.scandir(_ALBUM_ART_CACHE_DIR) as entries:
+            cached_files: List[os.DirEntry] = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".png") and entry.is_file()
+            ]
+        excess: int = len(cached_files) - _ALBUM_ART_DISK_CACHE_SIZE
+        if excess <= 0:
+            return
+        cached_files.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in cached_files[:excess]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                # Already removed by a concurrent prune
+                pass
+        self.logger.debug("Removed %d album art images from the disk cache.", excess)
 
     def load_album_art_async(self, url: str) -> None:
         """
@@ -466,11 +796,24 @@ class HomeTab:
             url (str): URL of the album art image.
         """
         try:
-            threading.Thread(
-                target=self._load_album_art, args=(url,), daemon=True
-            ).start()
+            self._dynamic_vars["album_art_generation"] += 1
+            self._dynamic_vars["album_art_executor"].submit(
+                self._load_album_art, url, self._dynamic_vars["album_art_generation"]
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.error("Failed to submit album art loading task: %s", e)
+
+    def shutdown(self) -> None:
+        """
+        Stop the album art worker threads, cancelling downloads that have not started,
+        so closing the window does not wait for them.
+        """
+        try:
+            self._dynamic_vars["album_art_executor"].shutdown(
+                wait=False, cancel_futures=True
+            )
         except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.error("Failed to start thread for loading album art: %s", e)
+            self.logger.error("Failed to stop album art workers: %s", e)
 
     def clear_logs(self) -> None:
         """
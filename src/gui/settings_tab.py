@@ -4,13 +4,23 @@ It allows users to configure various application settings such as Spotify creden
 log level, appearance mode, color theme, and skip thresholds.
 """
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 from CTkToolTip import CTkToolTip
-from config_utils import set_config_variable  # pylint: disable=import-error
+from config_utils import (  # pylint: disable=import-error
+    ENCRYPTED_KEYS,
+    set_config_variable,
+)
 from utils import resource_path  # pylint: disable=import-error
 
+# Labels for the configuration variables shown as text entries, in display order
+_KEY_LABELS: Dict[str, str] = {
+    "SPOTIFY_CLIENT_ID": "Spotify Client Id",
+    "SPOTIFY_CLIENT_SECRET": "Spotify Client Secret",
+    "SPOTIFY_REDIRECT_URI": "Spotify Redirect Uri",
+}
+
 
 class SettingsTab:
     """
@@ -22,6 +32,7 @@ class SettingsTab:
         parent: ctk.CTkFrame,
         app_config: Dict[str, Any],
         app_logger: Any,
+        log_settings_callback: Optional[Callable[[], None]] = None,
     ) -> None:
         """
         Initialize the SettingsTab.
@@ -30,11 +41,16 @@ class SettingsTab:
             parent (ctk.CTkFrame): The parent frame for the Settings tab.
             app_config (Dict[str, Any]): The current configuration dictionary.
             app_logger (Any): The logger instance for logging activities.
+            log_settings_callback (Optional[Callable[[], None]], optional): Function
+                to call after the log display settings are saved. Defaults to None.
         """
         try:
             self._parent: ctk.CTkFrame = parent
             self._config: Dict[str, Any] = app_config
             self._logger: Any = app_logger
+            self._log_settings_callback: Optional[Callable[[], None]] = (
+                log_settings_callback
+            )
 
             self._widgets: Dict[str, Any] = {}
 
@@ -92,13 +108,7 @@ class SettingsTab:
         """
         try:
             self._settings_entries: Dict[str, ctk.CTkEntry] = {}
-            required_keys: list[str] = [
-                "SPOTIFY_CLIENT_ID",
-                "SPOTIFY_CLIENT_SECRET",
-                "SPOTIFY_REDIRECT_URI",
-            ]
-
-            for key in required_keys:
+            for key in _KEY_LABELS:
                 self._create_config_variable_entry(key)
         except Exception as e:  # pylint: disable=broad-exception-caught
             self._logger.critical(
@@ -121,10 +131,9 @@ class SettingsTab:
             return
 
         try:
-            formatted_key: str = " ".join(
-                word.capitalize() for word in key.lower().split("_")
+            label = ctk.CTkLabel(
+                frame, text=f"{_KEY_LABELS[key]}:", width=160, anchor="w"
             )
-            label = ctk.CTkLabel(frame, text=f"{formatted_key}:", width=160, anchor="w")
             label.pack(side="left", padx=5, pady=3)
         except Exception as e:  # pylint: disable=broad-exception-caught
             self._logger.error("Failed to create label for key '%s': %s", key, e)
@@ -549,6 +558,8 @@ class SettingsTab:
             self._save_log_level()
             self._save_log_level_display()
             self._save_log_line_count()
+            if self._log_settings_callback:
+                self._log_settings_callback()
             self._save_appearance_mode()
             self._apply_default_color_theme()
             self._save_skip_threshold()
@@ -623,7 +634,7 @@ class SettingsTab:
                     justify="center",
                 )
                 raise ValueError(f"{key} cannot be empty.")
-            encrypt: bool = key in {"SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET"}
+            encrypt: bool = key in ENCRYPTED_KEYS
             set_config_variable(key, value, encrypt=encrypt)
             self._config[key] = value
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -5,14 +5,29 @@ allowing users to refresh the data and enforce skip threshold settings.
 """
 
 import json
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 from utils import load_skip_count, save_skip_count, unlike_song  # pylint: disable=import-error  # type: ignore
 from config_utils import load_config  # pylint: disable=import-error  # type: ignore
 
+_DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%S"
+_TIMEFRAME_UNITS: Dict[str, timedelta] = {
+    "days": timedelta(days=1),
+    "weeks": timedelta(weeks=1),
+    "months": timedelta(days=30),
+    "years": timedelta(days=365),
+}
+# Maximum number of concurrent unlike requests during a refresh
+_UNLIKE_WORKERS: int = 4
+# Treeview item ID of the row used for "No data" and error messages
+_MESSAGE_ROW_IID: str = "__message__"
+
 
 class SkippedTab:
     """
@@ -37,6 +52,12 @@ class SkippedTab:
             self.parent: ctk.CTkFrame = parent
             self.config: Dict[str, Any] = app_config
             self.logger: Any = app_logger
+            self._refresh_inflight: bool = False
+            # Values of the rows currently shown in the treeview, keyed by track ID
+            self._displayed_rows: Dict[str, Tuple[Any, ...]] = {}
+            # Incremented per load and per applied refresh so rows from a stale
+            # background load are discarded
+            self._load_generation: int = 0
 
             # Configure grid layout
             self.parent.grid_rowconfigure(1, weight=1)
@@ -126,48 +147,179 @@ class SkippedTab:
     def load_skipped_data(self) -> None:
         """
         Load and display the skipped songs data from skip_count.json.
+
+        The file is parsed on a background thread, and the rows are inserted on the
+        Tk main thread.
+        """
+        self._load_generation += 1
+        threading.Thread(
+            target=self._read_skipped_rows, args=(self._load_generation,), daemon=True
+        ).start()
+
+    def _read_skipped_rows(self, generation: int) -> None:
+        """
+        Build the treeview rows from skip_count.json off the Tk main thread, then
+        schedule their insertion on the main thread.
+
+        Args:
+            generation (int): The load generation the rows belong to.
         """
+        rows: List[Tuple[str, Tuple[Any, ...]]] = []
+        message: Optional[str] = None
         try:
-            skip_data: Dict[str, Any] = load_skip_count()
-            if skip_data:
-                for track_id, data in skip_data.items():
-                    try:
-                        skipped_count: int = data.get("skipped", 0)
-                        not_skipped_count: int = data.get("not_skipped", 0)
-                        last_skipped: str = data.get("last_skipped", "N/A")
-                        self.skipped_tree.insert(
-                            "",
-                            "end",
-                            iid=track_id,
-                            values=(
-                                track_id,
-                                skipped_count,
-                                not_skipped_count,
-                                last_skipped,
-                            ),
-                        )
-                    except Exception as e:  # pylint: disable=broad-exception-caught
-                        self.logger.error(
-                            "Failed to insert track data for %s: %s", track_id, e
-                        )
-            else:
-                self.skipped_tree.insert("", "end", values=("No data", "", "", ""))
+            for track_id, data in load_skip_count().items():
+                try:
+                    rows.append((track_id, self._row_values(track_id, data)))
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.logger.error(
+                        "Failed to read track data for %s: %s", track_id, e
+                    )
         except FileNotFoundError:
-            self.skipped_tree.insert(
-                "", "end", values=("Skip count file not found.", "", "", "")
-            )
+            message = "Skip count file not found."
         except json.JSONDecodeError:
-            self.skipped_tree.insert(
-                "", "end", values=("Error decoding skip count file.", "", "", "")
-            )
+            message = "Error decoding skip count file."
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.critical("Critical failure in load_skipped_data: %s", e)
-            raise
+            message = "Error loading skip count file."
+        self.parent.after(0, self._insert_skipped_rows, rows, message, generation)
+
+    def _insert_skipped_rows(
+        self,
+        rows: List[Tuple[str, Tuple[Any, ...]]],
+        message: Optional[str],
+        generation: int,
+    ) -> None:
+        """
+        Insert the skipped songs rows into the treeview.
+
+        The rows are dropped if another load was started or a refresh was applied
+        after they were read, as they would be out of date.
+
+        Args:
+            rows (List[Tuple[str, Tuple[Any, ...]]]): The track IDs and row values.
+            message (Optional[str]): A message to show instead of the data, if the
+                skip count file could not be read.
+            generation (int): The load generation the rows belong to.
+        """
+        if generation != self._load_generation:
+            self.logger.debug("Discarding skipped songs rows from a stale load.")
+            return
+        insert = self.skipped_tree.insert
+        log_error = self.logger.error
+        displayed_rows = self._displayed_rows
+        for track_id, values in rows:
+            try:
+                insert("", "end", iid=track_id, values=values)
+                displayed_rows[track_id] = values
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                log_error("Failed to insert track data for %s: %s", track_id, e)
+        if message:
+            self._show_message_row(message)
+        elif not displayed_rows:
+            self._show_message_row("No data")
+
+    @staticmethod
+    def _row_values(track_id: str, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Build the treeview row values for a track.
+
+        Args:
+            track_id (str): The Spotify track ID.
+            data (Dict[str, Any]): The skip count data for the track.
+
+        Returns:
+            Tuple[Any, ...]: The values of the track's treeview row.
+        """
+        data_get = data.get
+        return (
+            track_id,
+            data_get("skipped", 0),
+            data_get("not_skipped", 0),
+            data_get("last_skipped", "N/A"),
+        )
+
+    def _show_message_row(self, message: str) -> None:
+        """
+        Show a message in place of the skipped songs data.
+
+        Args:
+            message (str): The message to show.
+        """
+        if self.skipped_tree.exists(_MESSAGE_ROW_IID):
+            self.skipped_tree.item(_MESSAGE_ROW_IID, values=(message, "", "", ""))
+        else:
+            self.skipped_tree.insert(
+                "", "end", iid=_MESSAGE_ROW_IID, values=(message, "", "", "")
+            )
+
+    def _apply_skipped_rows(self, skip_count: Dict[str, Any]) -> None:
+        """
+        Update the treeview to match the skip count data, touching only the rows
+        that were added, removed, changed, or moved.
+
+        Args:
+            skip_count (Dict[str, Any]): The skip count data, in display order.
+        """
+        # Rows from a background load still in progress are older than these
+        self._load_generation += 1
+        tree = self.skipped_tree
+        displayed_rows = self._displayed_rows
+        new_rows: Dict[str, Tuple[Any, ...]] = {
+            track_id: self._row_values(track_id, data)
+            for track_id, data in skip_count.items()
+        }
+
+        removed = displayed_rows.keys() - new_rows.keys()
+        if tree.exists(_MESSAGE_ROW_IID):
+            removed.add(_MESSAGE_ROW_IID)
+        if removed:
+            tree.delete(*removed)
+        for track_id in removed:
+            displayed_rows.pop(track_id, None)
+
+        for track_id, values in new_rows.items():
+            displayed_values = displayed_rows.get(track_id)
+            if displayed_values is None:
+                tree.insert("", "end", iid=track_id, values=values)
+            elif displayed_values != values:
+                tree.item(track_id, values=values)
+            displayed_rows[track_id] = values
+
+        # Reorder every row in one call, as moving rows one at a time walks the
+        # sibling list for each row
+        if list(tree.get_children()) != list(new_rows):
+            tree.set_children("", *new_rows)
+
+        if not new_rows:
+            self._show_message_row("No data")
 
     def refresh(self) -> None:
         """
         Refresh the skipped songs data and enforce skip threshold settings.
+
+        Configuration and skip count loading and any unlike requests run on a
+        background thread; the treeview is repopulated on the Tk main thread.
+        """
+        if self._refresh_inflight:
+            self.logger.debug("Refresh already in progress; ignoring request.")
+            return
+        try:
+            self._refresh_inflight = True
+            self.refresh_button.configure(state="disabled")
+            threading.Thread(target=self._refresh_worker, daemon=True).start()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._refresh_inflight = False
+            self.refresh_button.configure(state="normal")
+            self.logger.critical("Critical failure in refresh: %s", e)
+            raise
+
+    def _refresh_worker(self) -> None:
+        """
+        Load the configuration and skip counts and unlike tracks that exceed the
+        skip threshold, then schedule the treeview update on the Tk main thread.
         """
+        tracks_to_unlike: List[str] = []
+        skip_count: Optional[Dict[str, Any]] = None
         try:
             self._load_configuration()
             delta = self._calculate_timeframe_delta()
@@ -177,13 +329,38 @@ class SkippedTab:
             tracks_to_unlike = self._identify_tracks_to_unlike(skip_count, delta, now)
             if tracks_to_unlike:
                 self._unlike_tracks(tracks_to_unlike, skip_count)
-                self._notify_user(tracks_to_unlike)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.critical("Critical failure in refresh: %s", e)
+            skip_count = None
+        finally:
+            self.parent.after(0, self._refresh_finish, tracks_to_unlike, skip_count)
+
+    def _refresh_finish(
+        self, tracks_to_unlike: List[str], skip_count: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Notify the user about unliked tracks and update the treeview.
 
+        Args:
+            tracks_to_unlike (List[str]): The list of track IDs that have been unliked.
+            skip_count (Optional[Dict[str, Any]]): The refreshed skip count data, or
+                None if it could not be loaded, in which case the treeview is
+                reloaded from skip_count.json.
+        """
+        try:
+            if tracks_to_unlike:
+                self._notify_user(tracks_to_unlike)
+            if skip_count is not None:
+                try:
+                    self._apply_skipped_rows(skip_count)
+                    return
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.logger.error("Failed to update skipped data rows: %s", e)
             self._clear_existing_data()
             self._reload_skipped_data()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.critical("Critical failure in refresh: %s", e)
-            raise
+        finally:
+            self._refresh_inflight = False
+            self.refresh_button.configure(state="normal")
 
     def _load_configuration(self) -> None:
         """
@@ -201,15 +378,9 @@ class SkippedTab:
         """
         timeframe_value = self.config.get("TIMEFRAME_VALUE", 1)
         timeframe_unit = self.config.get("TIMEFRAME_UNIT", "weeks")
-        if timeframe_unit == "days":
-            return timedelta(days=timeframe_value)
-        if timeframe_unit == "weeks":
-            return timedelta(weeks=timeframe_value)
-        if timeframe_unit == "months":
-            return timedelta(days=30 * timeframe_value)
-        if timeframe_unit == "years":
-            return timedelta(days=365 * timeframe_value)
-        return timedelta(days=timeframe_value)  # Default to days
+        # Default to days
+        unit = _TIMEFRAME_UNITS.get(timeframe_unit, _TIMEFRAME_UNITS["days"])
+        return unit * timeframe_value
 
     def _load_skip_count_data(self) -> Dict[str, Any]:
         """
@@ -239,53 +410,51 @@ class SkippedTab:
             List[str]: The list of track IDs to unlike.
         """
         skip_threshold = self.config.get("SKIP_THRESHOLD", 5)
-        tracks_to_unlike = []
+        # Skip dates use a fixed-width ISO 8601 layout, so they can be compared
+        # against the cutoff as plain strings without parsing each one
+        cutoff = (now - delta).strftime(_DATE_FORMAT)
+        tracks_to_unlike: List[str] = []
+        append = tracks_to_unlike.append
+        exceeds_threshold = self._track_exceeds_threshold
         for track_id, data in skip_count.items():
-            if self._track_exceeds_threshold(data, delta, now, skip_threshold):
-                tracks_to_unlike.append(track_id)
+            if exceeds_threshold(data, cutoff, skip_threshold):
+                append(track_id)
         return tracks_to_unlike
 
     def _track_exceeds_threshold(
-        self, data: Dict[str, Any], delta: timedelta, now: datetime, skip_threshold: int
+        self, data: Dict[str, Any], cutoff: str, skip_threshold: int
     ) -> bool:
         """
         Check if a track exceeds the skip threshold.
 
         Args:
             data (Dict[str, Any]): The skip count data for a track.
-            delta (timedelta): The timeframe delta.
-            now (datetime): The current date and time.
+            cutoff (str): The earliest skip date, formatted as _DATE_FORMAT, that
+                counts as recent.
             skip_threshold (int): The skip threshold.
 
         Returns:
             bool: True if the track exceeds the skip threshold, False otherwise.
         """
-        skipped_dates = data.get("skipped_dates", [])
-        recent_skips = [
-            datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
-            for date_str in skipped_dates
-            if self._is_recent_skip(date_str, delta, now)
-        ]
-        return len(recent_skips) >= skip_threshold
-
-    def _is_recent_skip(self, date_str: str, delta: timedelta, now: datetime) -> bool:
-        """
-        Determine if a skip is recent based on the delta.
-
-        Args:
-            date_str (str): The date string to check.
-            delta (timedelta): The timeframe delta.
-            now (datetime): The current date and time.
-
-        Returns:
-            bool: True if the skip is recent, False otherwise.
-        """
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
-            return now - date <= delta
-        except ValueError as ve:
-            self.logger.error("Invalid date format: %s", ve)
+        # skipped_dates is kept in ascending order (see utils.load_skip_count), so
+        # the recent skips are everything from the cutoff's insertion point onwards
+        skipped_dates = data.get("skipped_dates", ())
+        first_recent = bisect_left(skipped_dates, cutoff)
+        if len(skipped_dates) - first_recent < skip_threshold:
             return False
+        # Malformed entries can sort among the recent dates, so only valid dates
+        # count towards the threshold
+        valid_skips: int = 0
+        for skipped_date in skipped_dates[first_recent:]:
+            try:
+                datetime.fromisoformat(skipped_date)
+            except (TypeError, ValueError) as ve:
+                self.logger.error("Invalid date format: %s", ve)
+                continue
+            valid_skips += 1
+            if valid_skips >= skip_threshold:
+                return True
+        return valid_skips >= skip_threshold
 
     def _unlike_tracks(
         self, tracks_to_unlike: List[str], skip_count: Dict[str, Any]
@@ -293,24 +462,55 @@ class SkippedTab:
         """
         Unlike tracks that exceed the skip threshold.
 
+        The unlike requests are sent concurrently, and unliked tracks are removed
+        from the skip count data in place.
+
         Args:
             tracks_to_unlike (List[str]): The list of track IDs to unlike.
             skip_count (Dict[str, Any]): The skip count data.
         """
-        for track_id in tracks_to_unlike:
-            try:
-                self.logger.info(
-                    "Unliking track %s due to exceeding skip threshold.", track_id
-                )
-                unlike_song(track_id)
-                del skip_count[track_id]
-                self.logger.debug(
-                    "Removed track %s from skip_count after unliking.", track_id
-                )
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                self.logger.error("Failed to unlike track %s: %s", track_id, e)
+        with ThreadPoolExecutor(
+            max_workers=min(_UNLIKE_WORKERS, len(tracks_to_unlike))
+        ) as executor:
+            results = executor.map(self._unlike_track, tracks_to_unlike)
+            unliked = {
+                track_id
+                for track_id, succeeded in zip(tracks_to_unlike, results)
+                if succeeded
+            }
+
+        remaining = {
+            track_id: data
+            for track_id, data in skip_count.items()
+            if track_id not in unliked
+        }
+        skip_count.clear()
+        skip_count.update(remaining)
         self._save_updated_skip_count(skip_count)
 
+    def _unlike_track(self, track_id: str) -> bool:
+        """
+        Unlike a single track that exceeds the skip threshold.
+
+        Args:
+            track_id (str): The ID of the track to unlike.
+
+        Returns:
+            bool: True if the unlike request completed, False otherwise.
+        """
+        try:
+            self.logger.info(
+                "Unliking track %s due to exceeding skip threshold.", track_id
+            )
+            unlike_song(track_id)
+            self.logger.debug(
+                "Unliked track %s; it will be removed from skip_count.", track_id
+            )
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.error("Failed to unlike track %s: %s", track_id, e)
+            return False
+
     def _save_updated_skip_count(self, skip_count: Dict[str, Any]) -> None:
         """
         Save the updated skip count data.
@@ -346,8 +546,10 @@ class SkippedTab:
         Clear existing data from the treeview.
         """
         try:
-            for item in self.skipped_tree.get_children():
-                self.skipped_tree.delete(item)
+            children = self.skipped_tree.get_children()
+            if children:
+                self.skipped_tree.delete(*children)
+            self._displayed_rows.clear()
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to clear existing treeview data: %s", e)
 
@@ -0,0 +1,34 @@
+"""
+This module provides the HTTP sessions shared by all requests to the Spotify API,
+accounts service, and album art CDN.
+"""
+
+import requests
+
+
+def _make_session(pool_connections: int) -> requests.Session:
+    """
+    Create a session that reuses pooled keep-alive connections instead of opening a
+    new TLS connection for every request.
+
+    Args:
+        pool_connections (int): Number of hosts to keep connection pools for.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session: requests.Session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=8
+        ),
+    )
+    session.headers["User-Agent"] = "SpotifySkipTracker/1.0"
+    return session
+
+
+# Session for the Spotify API and token requests
+SPOTIFY_SESSION: requests.Session = _make_session(pool_connections=2)
+# Session for album art downloads from the Spotify image CDN
+ALBUM_ART_SESSION: requests.Session = _make_session(pool_connections=4)
@@ -0,0 +1,124 @@
+"""
+This module provides JSON encoding and decoding helpers for the application's data files.
+It uses orjson when it is installed and falls back to the standard library json module.
+"""
+
+import json
+import mmap
+import os
+import tempfile
+import time
+from typing import Any, Union
+
+try:
+    import orjson
+
+    _HAS_ORJSON: bool = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Attempts and delay in seconds for replacing a file that another process has open,
+# which Windows refuses with PermissionError
+_REPLACE_ATTEMPTS: int = 5
+_REPLACE_RETRY_DELAY: float = 0.05
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Deserialize JSON data.
+
+    Args:
+        data (Union[bytes, bytearray, str]): The JSON document to parse.
+
+    Returns:
+        Any: The parsed JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Parse a JSON file by memory-mapping it instead of reading it into a string first.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        Any: The parsed JSON value, or an empty dictionary if the file is empty.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with open(path, "rb") as file:
+        # mmap cannot map a zero-length file
+        if os.fstat(file.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if _HAS_ORJSON:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented, UTF-8 encoded JSON.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json_file_atomic(path: str, obj: Any) -> None:
+    """
+    Serialize an object to a JSON file atomically.
+
+    The encoded document is written in full to a uniquely named temporary file next
+    to the target, which then replaces the target, so readers never observe a
+    partially written file and concurrent writers never share a temporary file.
+    Replacing the target is retried briefly while it is held open.
+
+    Args:
+        path (str): Path to the JSON file.
+        obj (Any): The object to serialize.
+
+    Raises:
+        OSError: If the file cannot be written or replaced.
+    """
+    data: bytes = json_dumps(obj)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(path)}.",
+        suffix=".tmp",
+        dir=os.path.dirname(path) or ".",
+    )
+    try:
+        # A buffered writer writes the whole document, still in a single write
+        # call, where a raw file may write only part of it
+        with os.fdopen(tmp_fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        for attempt in range(_REPLACE_ATTEMPTS):
+            try:
+                os.replace(tmp_path, path)
+                break
+            except PermissionError:
+                if attempt == _REPLACE_ATTEMPTS - 1:
+                    raise
+                time.sleep(_REPLACE_RETRY_DELAY)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -8,6 +8,7 @@ load and save skip counts, unlike songs, and check if a song was skipped early.
 import time
 import logging
 import threading
+from bisect import insort
 from typing import Any, Optional, Dict, List, Callable
 from dataclasses import dataclass, field
 import json
@@ -89,7 +90,8 @@ class PlaybackMonitor:
             while not self.stop_flag.is_set():
                 playback = self._fetch_playback()
                 self._handle_playback(playback)
-                time.sleep(1)
+                # Returns straight away when monitoring is stopped
+                self.stop_flag.wait(1)
         except KeyboardInterrupt:
             logger.info("Playback monitoring interrupted by user.")
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -130,7 +132,7 @@ class PlaybackMonitor:
             return get_current_playback()
         except requests.exceptions.RequestException as e:
             logger.error("Network error while fetching current playback: %s", e)
-            time.sleep(5)
+            self.stop_flag.wait(5)
             return None
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.critical("Unexpected error while fetching current playback: %s", e)
@@ -173,20 +175,22 @@ class PlaybackMonitor:
         try:
             item: Dict[str, Any] = playback.get("item", {})
             track_id: str = item.get("id", "")
+            progress_ms: int = playback.get("progress_ms", 0)
+            if track_id == self.state.last_track_info.track_id:
+                self.state.last_progress = progress_ms
+                return
+
+            # Names are only needed when the track changes, so build them after the
+            # early return for the common same-track poll
             track_name: str = item.get("name", "")
             artist_names: str = ", ".join(
-                [artist.get("name", "") for artist in item.get("artists", [])]
+                artist.get("name", "") for artist in item.get("artists", [])
             )
-            progress_ms: int = playback.get("progress_ms", 0)
             duration_ms: int = item.get("duration_ms", 0)
         except (AttributeError, Exception) as e:  # pylint: disable=broad-exception-caught
             logger.error("Error extracting playback data: %s", e)
             return
 
-        if track_id == self.state.last_track_info.track_id:
-            self.state.last_progress = progress_ms
-            return
-
         logger.debug("New song: %s by %s (%s)", track_name, artist_names, track_id)
         self._initialize_skip_count_for_track(track_id)
 
@@ -339,9 +343,13 @@ class PlaybackMonitor:
         try:
             current_time: str = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
             if self.state.last_track_info.track_id:
-                self.state.skip_count[self.state.last_track_info.track_id].setdefault(
-                    "skipped_dates", []
-                ).append(current_time)
+                # Keep skipped_dates in ascending order for bisect lookups
+                insort(
+                    self.state.skip_count[
+                        self.state.last_track_info.track_id
+                    ].setdefault("skipped_dates", []),
+                    current_time,
+                )
                 self.state.skip_count[self.state.last_track_info.track_id][
                     "skipped"
                 ] += 1
@@ -9,17 +9,26 @@ import logging
 import json
 import os
 import sys
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import requests
 from auth import refresh_access_token
 from config_utils import get_config_variable, load_config
+from json_utils import load_json_file, write_json_file_atomic
+from http_utils import SPOTIFY_SESSION
 
+_SKIP_COUNT_FILE: str = "skip_count.json"
+# Serialises reading and saving skip_count.json across the playback and GUI threads
+_SKIP_COUNT_LOCK: threading.RLock = threading.RLock()
 _SPOTIFY_ACCESS_TOKEN: Optional[str] = get_config_variable(
     "SPOTIFY_ACCESS_TOKEN", "", decrypt=True
 )
 _logger: logging.Logger = logging.getLogger("SpotifySkipTracker")
 
+# Access token and the user ID it was last used to fetch
+_USER_ID_CACHE: Optional[Tuple[str, str]] = None
+
 
 def _auth_reload() -> None:
     """
@@ -45,12 +54,16 @@ def get_user_id(retries: int = 3) -> Optional[str]:
     """
     Get the Spotify user ID of the current user.
 
+    The user ID is cached for the current access token, so repeated calls with the
+    same token do not contact Spotify.
+
     Args:
         retries (int, optional): The number of retries if the request fails. Defaults to 3.
 
     Returns:
         Optional[str]: The Spotify user ID if the request is successful, None otherwise.
     """
+    global _USER_ID_CACHE  # pylint: disable=global-statement
     try:
         for attempt in range(retries):
             try:
@@ -59,13 +72,18 @@ def get_user_id(retries: int = 3) -> Optional[str]:
                 if not access_token:
                     _logger.error("Access token is not available.")
                     return None
+                if _USER_ID_CACHE and _USER_ID_CACHE[0] == access_token:
+                    return _USER_ID_CACHE[1]
                 headers: Dict[str, str] = {"Authorization": f"Bearer {access_token}"}
                 url: str = "https://api.spotify.com/v1/me"
-                response: requests.Response = requests.get(
+                response: requests.Response = SPOTIFY_SESSION.get(
                     url, headers=headers, timeout=10
                 )
                 if response.status_code == 200:
-                    return response.json().get("id")
+                    user_id: Optional[str] = response.json().get("id")
+                    if user_id:
+                        _USER_ID_CACHE = (access_token, user_id)
+                    return user_id
                 if response.status_code == 401:
                     _logger.debug("Access token expired. Refreshing token...")
                     time.sleep(5)
@@ -109,7 +127,7 @@ def get_current_playback(retries: int = 3) -> Optional[Dict[str, Any]]:
                 }
                 url: str = "https://api.spotify.com/v1/me/player"
 
-                response: requests.Response = requests.get(
+                response: requests.Response = SPOTIFY_SESSION.get(
                     url, headers=headers, timeout=5
                 )
                 if response.status_code == 200:
@@ -168,7 +186,7 @@ def get_recently_played_tracks(retries: int = 3) -> Dict[str, Any]:
                     "https://api.spotify.com/v1/me/player/recently-played?limit=5"
                 )
 
-                response: requests.Response = requests.get(
+                response: requests.Response = SPOTIFY_SESSION.get(
                     url, headers=headers, timeout=10
                 )
                 if response.status_code == 200:
@@ -209,16 +227,40 @@ def get_recently_played_tracks(retries: int = 3) -> Dict[str, Any]:
     return recently_played_tracks
 
 
+def _sort_skip_count(
+    skip_count: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Sort the skip count by the number of skips in descending order.
+
+    Args:
+        skip_count (Dict[str, Dict[str, Any]]): The skip count data.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The skip count data in display order.
+    """
+    return dict(
+        sorted(
+            skip_count.items(),
+            key=lambda item: item[1].get("skipped", 0),
+            reverse=True,
+        )
+    )
+
+
 def load_skip_count() -> Dict[str, Dict[str, Any]]:
     """
     Load the skip count from a JSON file.
 
+    Each track's "skipped_dates" list is returned sorted in ascending order, which
+    callers rely on to find recent skips with a binary search.
+
     Returns:
         Dict[str, Dict[str, Any]]: The skip count data if the file exists.
     """
-    try:
-        with open("skip_count.json", "r", encoding="utf-8") as file:
-            skip_count: Dict[str, Dict[str, Any]] = json.load(file)
+    with _SKIP_COUNT_LOCK:
+        try:
+            skip_count: Dict[str, Dict[str, Any]] = load_json_file(_SKIP_COUNT_FILE)
             # Update old format to new format
             for track_id, count in skip_count.items():
                 if isinstance(count, int):
@@ -227,43 +269,44 @@ def load_skip_count() -> Dict[str, Dict[str, Any]]:
                         "not_skipped": 0,
                         "last_skipped": None,
                     }
-            # Sort the skip count by the number of skips in descending order
-            sorted_skip_count: Dict[str, Dict[str, Any]] = dict(
-                sorted(
-                    skip_count.items(),
-                    key=lambda item: item[1]["skipped"],
-                    reverse=True,
-                )
-            )
+                elif count.get("skipped_dates"):
+                    count["skipped_dates"].sort()
+            sorted_skip_count: Dict[str, Dict[str, Any]] = _sort_skip_count(skip_count)
             save_skip_count(sorted_skip_count)
-        return sorted_skip_count
-    except FileNotFoundError:
-        _logger.debug("skip_count.json not found. Returning empty skip count.")
-        return {}
-    except json.JSONDecodeError as e:
-        _logger.critical("JSON decode error while loading skip count: %s", e)
-        raise
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        _logger.critical("Unexpected error while loading skip count: %s", e)
-        raise
+            return sorted_skip_count
+        except FileNotFoundError:
+            _logger.debug("skip_count.json not found. Returning empty skip count.")
+            return {}
+        except json.JSONDecodeError as e:
+            _logger.critical("JSON decode error while loading skip count: %s", e)
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            _logger.critical("Unexpected error while loading skip count: %s", e)
+            raise
 
 
 def save_skip_count(skip_count: Dict[str, Dict[str, Any]]) -> None:
     """
     Save the skip count to a JSON file.
 
+    Entries are written sorted by the number of skips, the order the Skipped tab
+    displays them in.
+    The file is replaced atomically rather than truncated in place, as
+    load_skip_count memory-maps it and reading a truncated mapping crashes the
+    process, and saves are serialised with loads by a module lock.
+
     Args:
         skip_count (Dict[str, Dict[str, Any]]): The skip count data to save.
     """
-    try:
-        with open("skip_count.json", "w", encoding="utf-8") as file:
-            json.dump(skip_count, file, indent=4)
-        _logger.debug("Skip count saved successfully.")
-    except (OSError, IOError) as e:
-        _logger.error("Failed to save skip count: %s", e)
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        _logger.critical("Unexpected error while saving skip count: %s", e)
-        raise
+    with _SKIP_COUNT_LOCK:
+        try:
+            write_json_file_atomic(_SKIP_COUNT_FILE, _sort_skip_count(skip_count))
+            _logger.debug("Skip count saved successfully.")
+        except (OSError, IOError) as e:
+            _logger.error("Failed to save skip count: %s", e)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            _logger.critical("Unexpected error while saving skip count: %s", e)
+            raise
 
 
 def check_if_skipped_early(progress_ms: int, duration_ms: int) -> bool:
@@ -330,7 +373,7 @@ def unlike_song(track_id: str, retries: int = 3) -> None:
                 }
                 url: str = f"https://api.spotify.com/v1/me/tracks?ids={track_id}"
 
-                response: requests.Response = requests.delete(
+                response: requests.Response = SPOTIFY_SESSION.delete(
                     url, headers=headers, timeout=10
                 )
                 if response.status_code == 200: